@@ -1,5 +1,7 @@
 """Main CLI entry point for dotfiles-cli."""
 
+import functools
+import sys
 from typing import Annotated, Optional
 
 from cyclopts import App, Parameter
@@ -12,10 +14,9 @@ GRP_FILES = "Files"
 GRP_SETUP = "Setup"
 GRP_QUICK = "Quick Access"
 GRP_SUB = "Subcommands"
-from .commands import (
-    sync, secrets, bootstrap, pkg, platform, scripts, utils, git_cmds,
-    templates, hooks, remote, update, validate, completions
-)
+
+# Command modules are imported lazily inside each wrapper body so a single
+# invocation only pays the import cost of the module it dispatches to.
 
 # Main app
 app = App(
@@ -24,31 +25,6 @@ app = App(
     version_flags=["--version", "-V"],
 )
 
-# Sub-apps for command groups
-secrets_app = App(name="secrets", help="Manage encrypted secrets (git-crypt)")
-pkg_app = App(name="pkg", help="Manage packages (wrapper for pkgmanager)")
-files_app = App(name="files", help="File management commands")
-mac_app = App(name="mac", help="macOS-specific commands")
-win_app = App(name="win", help="Windows-specific commands")
-util_app = App(name="util", help="Utility commands")
-git_app = App(name="git", help="Git helper commands")
-backup_app = App(name="backup", help="Backup and restore dotfiles")
-remote_app = App(name="remote", help="Remote deployment via SSH")
-hooks_app = App(name="hooks", help="Pre/post hooks management")
-completion_app = App(name="completion", help="Shell completions")
-
-app.command(secrets_app)
-app.command(pkg_app)
-app.command(files_app)
-app.command(mac_app)
-app.command(win_app)
-app.command(util_app)
-app.command(git_app)
-app.command(backup_app)
-app.command(remote_app)
-app.command(hooks_app)
-app.command(completion_app)
-
 
 # =============================================================================
 # Main commands
@@ -58,6 +34,8 @@ app.command(completion_app)
 @app.command(group=GRP_SYNC)
 def pull():
     """Pull latest changes and apply configs."""
+    from .commands import sync
+
     sync.pull()
 
 
@@ -66,6 +44,8 @@ def push(
     message: Annotated[str, Parameter(name=["-m", "--message"])] = "minor fix",
 ):
     """Commit and push dotfiles changes."""
+    from .commands import sync
+
     sync.push(message)
 
 
@@ -75,6 +55,8 @@ def apply(
     dry_run: Annotated[bool, Parameter(name=["-n", "--dry-run"])] = False,
 ):
     """Apply dotfiles to system (create symlinks/copies)."""
+    from .commands import sync
+
     sync.apply(force=force, dry_run=dry_run)
 
 
@@ -83,6 +65,8 @@ def collect(
     dry_run: Annotated[bool, Parameter(name=["-n", "--dry-run"])] = False,
 ):
     """Collect changes from system back to repo (reverse of apply)."""
+    from .commands import sync
+
     sync.collect(dry_run=dry_run)
 
 
@@ -92,6 +76,8 @@ def diff(
     file: Annotated[Optional[str], Parameter(name=["-f", "--file"])] = None,
 ):
     """Show pending changes (git status + file status)."""
+    from .commands import sync
+
     if full:
         sync.diff_full(file)
     else:
@@ -101,6 +87,8 @@ def diff(
 @app.command(group=GRP_SYNC)
 def status():
     """Show overall dotfiles status."""
+    from .commands import sync
+
     sync.status()
 
 
@@ -112,27 +100,40 @@ def add(
     platform_name: Annotated[Optional[str], Parameter(name=["-p", "--platform"])] = None,
 ):
     """Add a file to dotfiles tracking."""
+    from .commands import sync
+
     sync.add(file, type=type, secret=secret, platform=platform_name)
 
 
 @app.command(group=GRP_FILES)
 def remove(file: str):
     """Remove a file from dotfiles tracking."""
+    from .commands import sync
+
     sync.remove(file)
 
 
 @app.command(name="bootstrap", group=GRP_SETUP)
 def bootstrap_cmd(
-    stage: Annotated[Optional[str], Parameter(name=["-s", "--stage"])] = None,
+    stage: Annotated[
+        Optional[list[str]],
+        Parameter(name=["-s", "--stage"], consume_multiple=True),
+    ] = None,
 ):
     """Complete system setup after clone."""
+    from .commands import bootstrap
+
     bootstrap.bootstrap(stage)
 
 
 @app.command(group=GRP_SETUP)
-def doctor():
+def doctor(
+    fail_fast: Annotated[bool, Parameter(name=["--fail-fast"])] = False,
+):
     """Verify system health and configuration."""
-    bootstrap.doctor()
+    from .commands import bootstrap
+
+    bootstrap.doctor(fail_fast=fail_fast)
 
 
 @app.command(group=GRP_QUICK)
@@ -159,383 +160,506 @@ def run_script(
     list_all: Annotated[bool, Parameter(name=["-l", "--list"])] = False,
 ):
     """Run a script from scripts/ directory."""
+    from .commands import scripts
+
     if list_all or not name:
         scripts.list_scripts()
     else:
         scripts.run_script(name)
 
 
-publish_app = App(name="publish", help="Publish dotfiles (local or gist)")
-app.command(publish_app)
+@app.command(name="import", group=GRP_FILES)
+def import_cmd(
+    dry_run: Annotated[bool, Parameter(name=["-n", "--dry-run"])] = False,
+):
+    """Scan home directory for common dotfiles to track."""
+    from .commands import sync
+
+    sync.import_dotfiles(dry_run)
 
 
-@publish_app.command(name="local")
-def publish_local(
-    output: Annotated[Optional[str], Parameter(name=["-o", "--output"])] = None,
-    exclude: Annotated[Optional[list[str]], Parameter(name=["-e", "--exclude"])] = None,
-    no_push: Annotated[bool, Parameter(name=["--no-push"])] = False,
-    message: Annotated[str, Parameter(name=["-m", "--message"])] = "update",
-):
-    """Sync to public/ and push to public repo."""
-    sync.publish(output, exclude, push=not no_push, message=message)
+@app.command(name="update", group=GRP_SETUP)
+def update_cmd():
+    """Update dotfiles-cli to latest version."""
+    from .commands import update
 
+    update.update_cli()
 
-@publish_app.command(name="gist")
-def publish_gist(
-    gist_id: Annotated[Optional[str], Parameter(name=["-g", "--gist-id"])] = None,
-    repo: Annotated[Optional[str], Parameter(name=["-r", "--repo"])] = None,
-):
-    """Publish bootstrap script to GitHub gist."""
-    sync.publish_gist(gist_id, repo)
+
+@app.command(name="validate", group=GRP_SETUP)
+def validate_cmd():
+    """Validate all configuration files."""
+    from .commands import validate
+
+    validate.validate_all()
 
 
 # =============================================================================
-# Secrets commands (git-crypt)
+# Sub-apps
+#
+# Each group lives in a cached builder so registering ~40 leaf commands is
+# deferred until the group is actually selected on argv (or help is shown).
 # =============================================================================
 
 
-@secrets_app.command
-def init():
-    """Initialize git-crypt in the repo."""
-    secrets.init()
+@functools.cache
+def _build_publish_app() -> App:
+    publish_app = App(name="publish", help="Publish dotfiles (local or gist)")
 
+    @publish_app.command(name="local")
+    def publish_local(
+        output: Annotated[Optional[str], Parameter(name=["-o", "--output"])] = None,
+        exclude: Annotated[Optional[list[str]], Parameter(name=["-e", "--exclude"])] = None,
+        no_push: Annotated[bool, Parameter(name=["--no-push"])] = False,
+        message: Annotated[str, Parameter(name=["-m", "--message"])] = "update",
+    ):
+        """Sync to public/ and push to public repo."""
+        from .commands import sync
 
-@secrets_app.command
-def unlock(
-    key: Annotated[Optional[str], Parameter(name=["-k", "--key"])] = None,
-):
-    """Unlock secrets with git-crypt key."""
-    secrets.unlock(key)
+        sync.publish(output, exclude, push=not no_push, message=message)
 
+    @publish_app.command(name="gist")
+    def publish_gist(
+        gist_id: Annotated[Optional[str], Parameter(name=["-g", "--gist-id"])] = None,
+        repo: Annotated[Optional[str], Parameter(name=["-r", "--repo"])] = None,
+        prune_old: Annotated[bool, Parameter(name=["--prune-old"])] = False,
+    ):
+        """Publish bootstrap script to GitHub gist."""
+        from .commands import sync
 
-@secrets_app.command
-def lock():
-    """Lock secrets (re-encrypt locally)."""
-    secrets.lock()
+        sync.publish_gist(gist_id, repo, prune_old=prune_old)
 
+    return publish_app
 
-@secrets_app.command(name="status")
-def secrets_status():
-    """Show git-crypt status."""
-    secrets.status()
 
+@functools.cache
+def _build_secrets_app() -> App:
+    secrets_app = App(name="secrets", help="Manage encrypted secrets (git-crypt)")
 
-@secrets_app.command(name="export-key")
-def export_key(output: Optional[str] = None):
-    """Export git-crypt key for backup."""
-    secrets.export_key(output)
+    @secrets_app.command
+    def init():
+        """Initialize git-crypt in the repo."""
+        from .commands import secrets
 
+        secrets.init()
 
-@secrets_app.command(name="add-pattern")
-def add_pattern(pattern: str):
-    """Add encryption pattern to .gitattributes."""
-    secrets.add_pattern(pattern)
+    @secrets_app.command
+    def unlock(
+        key: Annotated[Optional[str], Parameter(name=["-k", "--key"])] = None,
+    ):
+        """Unlock secrets with git-crypt key."""
+        from .commands import secrets
 
+        secrets.unlock(key)
 
-@secrets_app.command(name="list")
-def secrets_list():
-    """List all encrypted files."""
-    secrets.list_encrypted()
+    @secrets_app.command
+    def lock():
+        """Lock secrets (re-encrypt locally)."""
+        from .commands import secrets
 
+        secrets.lock()
 
-# =============================================================================
-# Package commands (pkgmanager wrapper)
-# =============================================================================
+    @secrets_app.command(name="status")
+    def secrets_status():
+        """Show git-crypt status."""
+        from .commands import secrets
 
+        secrets.status()
 
-@pkg_app.command(name="init")
-def pkg_init(
-    types: Annotated[Optional[str], Parameter(name=["-t", "--types"])] = None,
-):
-    """Install all packages from manifest."""
-    pkg.init(types)
+    @secrets_app.command(name="export-key")
+    def export_key(output: Optional[str] = None):
+        """Export git-crypt key for backup."""
+        from .commands import secrets
 
+        secrets.export_key(output)
 
-@pkg_app.command(name="install")
-def pkg_install(type: str, name: str):
-    """Install and track a package."""
-    pkg.install(type, name)
+    @secrets_app.command(name="add-pattern")
+    def add_pattern(pattern: str):
+        """Add encryption pattern to .gitattributes."""
+        from .commands import secrets
 
+        secrets.add_pattern(pattern)
 
-@pkg_app.command(name="remove")
-def pkg_remove(type: str, name: str):
-    """Remove and untrack a package."""
-    pkg.remove(type, name)
+    @secrets_app.command(name="list")
+    def secrets_list():
+        """List all encrypted files."""
+        from .commands import secrets
 
+        secrets.list_encrypted()
 
-@pkg_app.command(name="update")
-def pkg_update():
-    """Update all packages."""
-    pkg.update()
+    return secrets_app
 
 
-@pkg_app.command(name="list")
-def pkg_list():
-    """List installed packages."""
-    pkg.list_packages()
+@functools.cache
+def _build_pkg_app() -> App:
+    pkg_app = App(name="pkg", help="Manage packages (wrapper for pkgmanager)")
 
+    @pkg_app.command(name="init")
+    def pkg_init(
+        types: Annotated[Optional[str], Parameter(name=["-t", "--types"])] = None,
+    ):
+        """Install all packages from manifest."""
+        from .commands import pkg
 
-@pkg_app.command(name="install-tool")
-def pkg_install_tool():
-    """Install pkgmanager itself."""
-    pkg.install_tool()
+        pkg.init(types)
 
+    @pkg_app.command(name="install")
+    def pkg_install(type: str, name: str):
+        """Install and track a package."""
+        from .commands import pkg
 
-# =============================================================================
-# macOS commands
-# =============================================================================
+        pkg.install(type, name)
 
+    @pkg_app.command(name="remove")
+    def pkg_remove(type: str, name: str):
+        """Remove and untrack a package."""
+        from .commands import pkg
 
-@mac_app.command
-def backup():
-    """Backup macOS app settings via Mackup."""
-    platform.mac_backup()
+        pkg.remove(type, name)
 
+    @pkg_app.command(name="update")
+    def pkg_update():
+        """Update all packages."""
+        from .commands import pkg
 
-@mac_app.command
-def restore():
-    """Restore macOS app settings via Mackup."""
-    platform.mac_restore()
+        pkg.update()
 
+    @pkg_app.command(name="list")
+    def pkg_list():
+        """List installed packages."""
+        from .commands import pkg
 
-@mac_app.command
-def brewfile():
-    """Regenerate Brewfile from installed packages."""
-    platform.mac_brewfile()
+        pkg.list_packages()
 
+    @pkg_app.command(name="install-tool")
+    def pkg_install_tool():
+        """Install pkgmanager itself."""
+        from .commands import pkg
 
-# =============================================================================
-# Windows commands
-# =============================================================================
+        pkg.install_tool()
 
+    return pkg_app
 
-@win_app.command(name="user")
-def win_user():
-    """Print Windows user profile path (WSL)."""
-    platform.win_user()
 
+@functools.cache
+def _build_mac_app() -> App:
+    mac_app = App(name="mac", help="macOS-specific commands")
 
-@win_app.command(name="dist")
-def win_dist():
-    """Print running WSL distributions."""
-    platform.win_dist()
+    @mac_app.command
+    def backup():
+        """Backup macOS app settings via Mackup."""
+        from .commands import platform
 
+        platform.mac_backup()
 
-@win_app.command(name="run")
-def win_run(
-    cmd: Annotated[list[str], Parameter(consume_multiple=True, allow_leading_hyphen=True)],
-):
-    """Run a Windows command via cmd.exe (/C)."""
-    platform.win_run(cmd)
+    @mac_app.command
+    def restore():
+        """Restore macOS app settings via Mackup."""
+        from .commands import platform
 
+        platform.mac_restore()
 
-# =============================================================================
-# Files commands
-# =============================================================================
+    @mac_app.command
+    def brewfile():
+        """Regenerate Brewfile from installed packages."""
+        from .commands import platform
 
+        platform.mac_brewfile()
 
-@files_app.command(name="list")
-def files_list():
-    """List all tracked files."""
-    from .files.manifest import Manifest
-    from .utils.console import console, create_table
+    return mac_app
 
-    cfg = get_config()
-    manifest = Manifest.load(cfg.files_yaml)
 
-    if not manifest.entries:
-        console.print("No files in manifest")
-        return
+@functools.cache
+def _build_win_app() -> App:
+    win_app = App(name="win", help="Windows-specific commands")
 
-    table = create_table("Type", "Source", "Destination", "Platform")
+    @win_app.command(name="user")
+    def win_user():
+        """Print Windows user profile path (WSL)."""
+        from .commands import platform
 
-    for entry in manifest.entries:
-        plat = entry.platform or "all"
-        table.add_row(entry.type, str(entry.source), f"~/{entry.dest}", plat)
+        platform.win_user()
 
-    console.print(table)
+    @win_app.command(name="dist")
+    def win_dist():
+        """Print running WSL distributions."""
+        from .commands import platform
 
+        platform.win_dist()
 
-@files_app.command(name="check")
-def files_check():
-    """Verify file status."""
-    sync.diff()
+    @win_app.command(name="run")
+    def win_run(
+        cmd: Annotated[list[str], Parameter(consume_multiple=True, allow_leading_hyphen=True)],
+    ):
+        """Run a Windows command via cmd.exe (/C)."""
+        from .commands import platform
 
+        platform.win_run(cmd)
 
-# =============================================================================
-# Utility commands
-# =============================================================================
+    return win_app
 
 
-@util_app.command(name="ip")
-def util_ip(
-    all_info: Annotated[bool, Parameter(name=["-a", "--all"])] = False,
-):
-    """Get public IP address."""
-    utils.get_ip(all_info)
+@functools.cache
+def _build_files_app() -> App:
+    files_app = App(name="files", help="File management commands")
 
+    @files_app.command(name="list")
+    def files_list():
+        """List all tracked files."""
+        from .files.manifest import Manifest
+        from .utils.console import console, create_table
 
-@util_app.command
-def serve(
-    port: Annotated[int, Parameter(name=["-p", "--port"])] = 8080,
-    bind: Annotated[Optional[str], Parameter(name=["-b", "--bind"])] = None,
-):
-    """Start HTTP server in current directory."""
-    utils.serve(port, bind)
+        cfg = get_config()
+        manifest = Manifest.load(cfg.files_yaml)
 
+        if not manifest.entries:
+            console.print("No files in manifest")
+            return
 
-@util_app.command(name="ghostty")
-def util_ghostty(host: str):
-    """Setup ghostty terminfo on remote host."""
-    utils.init_ghostty(host)
+        table = create_table("Type", "Source", "Destination", "Platform")
 
+        for entry in manifest.entries:
+            plat = entry.platform or "all"
+            table.add_row(entry.type, str(entry.source), f"~/{entry.dest}", plat)
 
-@util_app.command(name="ssh-init")
-def util_ssh_init(
-    host: str,
-    user: Annotated[Optional[str], Parameter(name=["-u", "--user"])] = None,
-    hostname: Annotated[Optional[str], Parameter(name=["-H", "--hostname"])] = None,
-    port: Annotated[int, Parameter(name=["-p", "--port"])] = 22,
-):
-    """Initialize SSH key, copy to remote, and update config."""
-    utils.ssh_init(host, user, hostname, port)
+        console.print(table)
 
+    @files_app.command(name="check")
+    def files_check():
+        """Verify file status."""
+        from .commands import sync
 
-# =============================================================================
-# Git helper commands
-# =============================================================================
+        sync.diff()
 
+    return files_app
 
-@git_app.command(name="init")
-def git_init(
-    name: str,
-    public: Annotated[bool, Parameter(name=["-p", "--public"])] = False,
-):
-    """Initialize git repo and create GitHub repository."""
-    git_cmds.init_hub(name, public)
 
+@functools.cache
+def _build_util_app() -> App:
+    util_app = App(name="util", help="Utility commands")
 
-@git_app.command
-def quick(
-    message: Annotated[str, Parameter(name=["-m", "--message"])] = "minor fix",
-):
-    """Quick commit and push all changes (any repo)."""
-    git_cmds.quick(message)
+    @util_app.command(name="ip")
+    def util_ip(
+        all_info: Annotated[bool, Parameter(name=["-a", "--all"])] = False,
+    ):
+        """Get public IP address."""
+        from .commands import utils
 
+        utils.get_ip(all_info)
 
-# =============================================================================
-# Backup commands
-# =============================================================================
+    @util_app.command
+    def serve(
+        port: Annotated[int, Parameter(name=["-p", "--port"])] = 8080,
+        bind: Annotated[Optional[str], Parameter(name=["-b", "--bind"])] = None,
+    ):
+        """Start HTTP server in current directory."""
+        from .commands import utils
 
+        utils.serve(port, bind)
 
-@backup_app.command(name="create")
-def backup_create(
-    name: Annotated[Optional[str], Parameter(name=["-n", "--name"])] = None,
-):
-    """Create a backup of current dotfiles state."""
-    sync.backup(name)
+    @util_app.command(name="ghostty")
+    def util_ghostty(host: str):
+        """Setup ghostty terminfo on remote host."""
+        from .commands import utils
 
+        utils.init_ghostty(host)
 
-@backup_app.command(name="restore")
-def backup_restore(name: str):
-    """Restore dotfiles from a backup."""
-    sync.restore_backup(name)
+    @util_app.command(name="ssh-init")
+    def util_ssh_init(
+        host: str,
+        user: Annotated[Optional[str], Parameter(name=["-u", "--user"])] = None,
+        hostname: Annotated[Optional[str], Parameter(name=["-H", "--hostname"])] = None,
+        port: Annotated[int, Parameter(name=["-p", "--port"])] = 22,
+    ):
+        """Initialize SSH key, copy to remote, and update config."""
+        from .commands import utils
 
+        utils.ssh_init(host, user, hostname, port)
 
-@backup_app.command(name="list")
-def backup_list():
-    """List available backups."""
-    sync.list_backups()
+    return util_app
 
 
-# =============================================================================
-# Remote commands
-# =============================================================================
+@functools.cache
+def _build_git_app() -> App:
+    git_app = App(name="git", help="Git helper commands")
 
+    @git_app.command(name="init")
+    def git_init(
+        name: str,
+        public: Annotated[bool, Parameter(name=["-p", "--public"])] = False,
+    ):
+        """Initialize git repo and create GitHub repository."""
+        from .commands import git_cmds
 
-@remote_app.command(name="deploy")
-def remote_deploy(
-    host: str,
-    path: Annotated[str, Parameter(name=["-p", "--path"])] = "~/dotfiles",
-    bootstrap_flag: Annotated[bool, Parameter(name=["-b", "--bootstrap"])] = False,
-):
-    """Deploy dotfiles to a remote host via SSH."""
-    remote.deploy(host, path, bootstrap_flag)
+        git_cmds.init_hub(name, public)
 
+    @git_app.command
+    def quick(
+        message: Annotated[str, Parameter(name=["-m", "--message"])] = "minor fix",
+    ):
+        """Quick commit and push all changes (any repo)."""
+        from .commands import git_cmds
 
-@remote_app.command(name="sync-from")
-def remote_sync_from(
-    host: str,
-    path: Annotated[str, Parameter(name=["-p", "--path"])] = "~/dotfiles",
-):
-    """Sync dotfiles from a remote host."""
-    remote.sync_from(host, path)
+        git_cmds.quick(message)
 
+    return git_app
 
-# =============================================================================
-# Hooks commands
-# =============================================================================
 
+@functools.cache
+def _build_backup_app() -> App:
+    backup_app = App(name="backup", help="Backup and restore dotfiles")
 
-@hooks_app.command(name="list")
-def hooks_list():
-    """List available hooks."""
-    hooks.list_hooks()
+    @backup_app.command(name="create")
+    def backup_create(
+        name: Annotated[Optional[str], Parameter(name=["-n", "--name"])] = None,
+    ):
+        """Create a backup of current dotfiles state."""
+        from .commands import sync
 
+        sync.backup(name)
 
-@hooks_app.command(name="create")
-def hooks_create(
-    name: str,
-    phase: Annotated[str, Parameter(name=["-p", "--phase"])] = "pre",
-):
-    """Create a new hook script."""
-    hooks.create_hook(name, phase)
+    @backup_app.command(name="restore")
+    def backup_restore(name: str):
+        """Restore dotfiles from a backup."""
+        from .commands import sync
 
+        sync.restore_backup(name)
 
-# =============================================================================
-# Completion commands
-# =============================================================================
+    @backup_app.command(name="list")
+    def backup_list():
+        """List available backups."""
+        from .commands import sync
 
+        sync.list_backups()
 
-@completion_app.command(name="generate")
-def completion_generate(
-    shell: Annotated[str, Parameter(name=["-s", "--shell"])] = "fish",
-):
-    """Generate shell completions."""
-    completions.generate(shell)
+    return backup_app
 
 
-@completion_app.command(name="install")
-def completion_install(
-    shell: Annotated[str, Parameter(name=["-s", "--shell"])] = "fish",
-):
-    """Install shell completions."""
-    completions.install(shell)
+@functools.cache
+def _build_remote_app() -> App:
+    remote_app = App(name="remote", help="Remote deployment via SSH")
+
+    @remote_app.command(name="deploy")
+    def remote_deploy(
+        host: Annotated[list[str], Parameter(consume_multiple=True)],
+        path: Annotated[str, Parameter(name=["-p", "--path"])] = "~/dotfiles",
+        bootstrap_flag: Annotated[bool, Parameter(name=["-b", "--bootstrap"])] = False,
+        force: Annotated[bool, Parameter(name=["-f", "--force"])] = False,
+    ):
+        """Deploy dotfiles to one or more remote hosts via SSH."""
+        from .commands import remote
 
+        if len(host) == 1:
+            remote.deploy(host[0], path, bootstrap_flag, force)
+        else:
+            remote.deploy_many(host, path, bootstrap_flag)
 
-# =============================================================================
-# Additional main commands
-# =============================================================================
+    @remote_app.command(name="sync-from")
+    def remote_sync_from(
+        host: str,
+        path: Annotated[str, Parameter(name=["-p", "--path"])] = "~/dotfiles",
+    ):
+        """Sync dotfiles from a remote host."""
+        from .commands import remote
 
+        remote.sync_from(host, path)
 
-@app.command(name="import", group=GRP_FILES)
-def import_cmd(
-    dry_run: Annotated[bool, Parameter(name=["-n", "--dry-run"])] = False,
-):
-    """Scan home directory for common dotfiles to track."""
-    sync.import_dotfiles(dry_run)
+    return remote_app
 
 
-@app.command(name="update", group=GRP_SETUP)
-def update_cmd():
-    """Update dotfiles-cli to latest version."""
-    update.update_cli()
+@functools.cache
+def _build_hooks_app() -> App:
+    hooks_app = App(name="hooks", help="Pre/post hooks management")
 
+    @hooks_app.command(name="list")
+    def hooks_list():
+        """List available hooks."""
+        from .commands import hooks
 
-@app.command(name="validate", group=GRP_SETUP)
-def validate_cmd():
-    """Validate all configuration files."""
-    validate.validate_all()
+        hooks.list_hooks()
+
+    @hooks_app.command(name="create")
+    def hooks_create(
+        name: str,
+        phase: Annotated[str, Parameter(name=["-p", "--phase"])] = "pre",
+    ):
+        """Create a new hook script."""
+        from .commands import hooks
+
+        hooks.create_hook(name, phase)
+
+    return hooks_app
+
+
+@functools.cache
+def _build_completion_app() -> App:
+    completion_app = App(name="completion", help="Shell completions")
+
+    @completion_app.command(name="generate")
+    def completion_generate(
+        shell: Annotated[str, Parameter(name=["-s", "--shell"])] = "fish",
+    ):
+        """Generate shell completions."""
+        from .commands import completions
+
+        completions.generate(shell)
+
+    @completion_app.command(name="install")
+    def completion_install(
+        shell: Annotated[str, Parameter(name=["-s", "--shell"])] = "fish",
+    ):
+        """Install shell completions."""
+        from .commands import completions
+
+        completions.install(shell)
+
+    return completion_app
+
+
+_SUB_APP_BUILDERS = {
+    "secrets": _build_secrets_app,
+    "pkg": _build_pkg_app,
+    "files": _build_files_app,
+    "mac": _build_mac_app,
+    "win": _build_win_app,
+    "util": _build_util_app,
+    "git": _build_git_app,
+    "backup": _build_backup_app,
+    "remote": _build_remote_app,
+    "hooks": _build_hooks_app,
+    "completion": _build_completion_app,
+    "publish": _build_publish_app,
+}
+
+
+# Frozen registry of root leaf commands (cyclopts-normalized names).
+# Dispatching one of these never needs any sub-app built. Keep in sync
+# with the @app.command definitions above.
+_ROOT_COMMANDS = frozenset({
+    "pull", "push", "apply", "collect", "diff", "status", "add", "remove",
+    "bootstrap", "doctor", "cd", "edit", "run-script", "import", "update",
+    "validate",
+})
+
+
+def _register_sub_apps():
+    """Register sub-apps, building only the argv-selected group when possible.
+
+    When the first argument names a group, only that group's App is built;
+    when it names a root leaf command, none are. For anything else (help,
+    completions, typos) all groups are built so listings stay complete.
+    """
+    argv = sys.argv[1:]
+    if argv:
+        first = argv[0]
+        if first in _ROOT_COMMANDS:
+            return
+        if first in _SUB_APP_BUILDERS:
+            app.command(_SUB_APP_BUILDERS[first]())
+            return
+
+    for build in _SUB_APP_BUILDERS.values():
+        app.command(build())
 
 
 # =============================================================================
@@ -545,6 +669,24 @@ def validate_cmd():
 
 def main():
     """Main entry point."""
+    # Micro fast path: `dotfiles cd` is meant for shell substitutions
+    # (cd $(dotfiles cd)), so answer it (and --version) straight from argv
+    # without paying for cyclopts dispatch at all.
+    if len(sys.argv) == 2:
+        arg = sys.argv[1]
+        if arg == "cd":
+            print(get_config().dotfiles_path)
+            return
+        if arg in ("--version", "-V"):
+            try:
+                from importlib.metadata import version
+
+                print(version("dotfiles-cli"))
+                return
+            except Exception:
+                pass  # fall through to cyclopts
+
+    _register_sub_apps()
     app()
 
 
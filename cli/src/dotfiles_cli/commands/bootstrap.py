@@ -1,33 +1,38 @@
 """Bootstrap commands: bootstrap, doctor."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from ..config import get_config
 from ..files.manifest import Manifest
 from ..files.linker import check_symlink
 from ..files.copier import check_copy
 from ..utils.console import success, error, warning, info, header, dim, console, create_table
-from ..utils.run import run, has_command, require_command
-from . import sync, secrets
+from ..utils.run import run, has_command, require_command, which_many
+from . import platform, sync, secrets
 
 
-STAGES = ["files", "rust", "packages", "secrets", "platform", "shell"]
+STAGES = ("files", "rust", "packages", "secrets", "platform", "shell")
+_STAGES_SET = frozenset(STAGES)
 
 
-def bootstrap(stage: Optional[str] = None):
+def bootstrap(stage: Optional[Union[str, list[str]]] = None):
     """Complete system setup.
 
     Args:
-        stage: Run specific stage only (comma-separated), or None for all
+        stage: Run specific stages only (comma-separated string or list),
+            or None for all
     """
     cfg = get_config()
 
-    stages_to_run = STAGES
+    stages_to_run = list(STAGES)
     if stage:
-        stages_to_run = [s.strip() for s in stage.split(",")]
+        if isinstance(stage, str):
+            stage = stage.split(",")
+        # Each element may itself be comma-separated ("files,rust")
+        stages_to_run = [s.strip() for part in stage for s in part.split(",")]
         for s in stages_to_run:
-            if s not in STAGES:
+            if s not in _STAGES_SET:
                 error(f"Unknown stage: {s}")
                 info(f"Available stages: {', '.join(STAGES)}")
                 return False
@@ -39,30 +44,9 @@ def bootstrap(stage: Optional[str] = None):
 
     for i, s in enumerate(stages_to_run):
         stage_num = f"[{i+1}/{len(stages_to_run)}]"
-
-        if s == "files":
-            header(f"{stage_num} Applying files")
-            sync.apply(force=True)
-
-        elif s == "rust":
-            header(f"{stage_num} Installing Rust")
-            _stage_rust(cfg)
-
-        elif s == "packages":
-            header(f"{stage_num} Installing packages")
-            _stage_packages(cfg)
-
-        elif s == "secrets":
-            header(f"{stage_num} Unlocking secrets")
-            _stage_secrets(cfg)
-
-        elif s == "platform":
-            header(f"{stage_num} Platform setup ({cfg.platform})")
-            _stage_platform(cfg)
-
-        elif s == "shell":
-            header(f"{stage_num} Shell setup")
-            _stage_shell(cfg)
+        label, stage_fn = _STAGE_FNS[s]
+        header(f"{stage_num} {label.format(platform=cfg.platform)}")
+        stage_fn(cfg)
 
     print()
     success("Bootstrap complete!")
@@ -87,7 +71,9 @@ def _stage_rust(cfg):
 
 def _stage_packages(cfg):
     """Install packages via pkgmanager."""
-    import os
+    import shutil
+
+    pkgmanager = "pkgmanager"
 
     # Install pkgmanager if not available
     if not has_command("pkgmanager"):
@@ -100,19 +86,28 @@ def _stage_packages(cfg):
 
         run(["uv", "tool", "install", "git+https://github.com/JiwanChung/pkgmanager.git"], check=False)
 
-    # Verify installation
-    if not has_command("pkgmanager"):
-        warning("pkgmanager installation failed, skipping package installation")
-        return
-
-    env = os.environ.copy()
-    env["PACKAGE_CONFIG"] = str(cfg.packages_yaml)
+        # Verify: the binary just appeared (if at all), so stat the uv tool
+        # bin dir directly before falling back to a full PATH resolution
+        uv_bin = Path.home() / ".local" / "bin" / "pkgmanager"
+        if shutil.which("pkgmanager") is None:
+            if not uv_bin.exists():
+                warning("pkgmanager installation failed, skipping package installation")
+                return
+            # Fresh bootstrap: the binary exists but ~/.local/bin is not
+            # on PATH yet, so invoke it by absolute path
+            pkgmanager = str(uv_bin)
 
-    run(["pkgmanager", "init"], check=False)
+    run(
+        [pkgmanager, "init"],
+        check=False,
+        extra_env={"PACKAGE_CONFIG": str(cfg.packages_yaml)},
+    )
 
 
 def _stage_secrets(cfg):
     """Unlock secrets if git-crypt is available and key exists."""
+    # One stat settles both questions: .git/git-crypt only exists when
+    # the repo exists AND git-crypt has been initialized in it
     git_crypt_dir = cfg.dotfiles_path / ".git" / "git-crypt"
 
     if not git_crypt_dir.exists():
@@ -144,23 +139,23 @@ def _stage_platform(cfg):
 
 def _setup_macos(cfg):
     """macOS-specific setup."""
+    # One PATH scan for both tool probes
+    found = which_many(["brew", "mackup"])
+    mac_dir = cfg.platform_path / "mac"
+
     # Homebrew
-    if not has_command("brew"):
-        info("Installing Homebrew...")
-        run(
-            ["sh", "-c", '/bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"'],
-            check=False
-        )
+    if not found["brew"]:
+        platform.install_homebrew()
 
     # Brewfile
-    brewfile = cfg.platform_path / "mac" / "Brewfile"
-    if brewfile.exists():
+    brewfile = mac_dir / "Brewfile"
+    if brewfile.is_file():
         info("Installing from Brewfile...")
         run(["brew", "bundle", f"--file={brewfile}"], check=False)
 
     # Mackup restore
-    mackup_cfg = cfg.platform_path / "mac" / "mackup" / ".mackup.cfg"
-    if mackup_cfg.exists() and has_command("mackup"):
+    mackup_cfg = mac_dir / "mackup" / ".mackup.cfg"
+    if found["mackup"] and mackup_cfg.is_file():
         info("Restoring Mackup settings...")
         run(["mackup", "restore", "-f"], check=False)
 
@@ -186,12 +181,52 @@ def _stage_shell(cfg):
             run([interpreter, str(script_path)], check=False)
 
 
-def doctor():
-    """Verify system health."""
+# Stage dispatch: name -> (header label, stage function)
+_STAGE_FNS = {
+    "files": ("Applying files", lambda cfg: sync.apply(force=True)),
+    "rust": ("Installing Rust", _stage_rust),
+    "packages": ("Installing packages", _stage_packages),
+    "secrets": ("Unlocking secrets", _stage_secrets),
+    "platform": ("Platform setup ({platform})", _stage_platform),
+    "shell": ("Shell setup", _stage_shell),
+}
+
+
+# File checker by entry type; anything unknown is treated as a copy
+_CHECKERS = {"symlink": check_symlink, "copy": check_copy}
+
+
+def doctor(fail_fast: bool = False):
+    """Verify system health.
+
+    Args:
+        fail_fast: Stop the file scan at the first entry needing attention
+    """
+    import subprocess
+
     cfg = get_config()
 
     header("System Health Check")
 
+    # Required tools (one PATH scan for all of them)
+    tools = [
+        ("git", ""),
+        ("git-crypt", "brew install git-crypt"),
+        ("fish", ""),
+        ("pkgmanager", "dotfiles pkg install-tool"),
+    ]
+    found = which_many([tool for tool, _ in tools] + ["gh"])
+
+    # Kick off the gh auth probe right away; its network roundtrip
+    # overlaps the local stat checks below and we collect it last
+    gh_proc = None
+    if found["gh"]:
+        gh_proc = subprocess.Popen(
+            ["gh", "auth", "status"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
     checks = []
 
     # Check: Git repo exists
@@ -201,25 +236,14 @@ def doctor():
     # Check: files.yaml exists
     checks.append(("files.yaml", cfg.files_yaml.exists(), str(cfg.files_yaml)))
 
-    # Check: Required tools
-    tools = [
-        ("git", ""),
-        ("git-crypt", "brew install git-crypt"),
-        ("fish", ""),
-        ("pkgmanager", "dotfiles pkg install-tool"),
-    ]
     for tool, hint in tools:
-        checks.append((f"Tool: {tool}", has_command(tool), hint))
+        checks.append((f"Tool: {tool}", found[tool], hint))
 
     # Check: git-crypt key
     checks.append(("git-crypt key", cfg.git_crypt_key.exists(), str(cfg.git_crypt_key)))
 
     # Check: GitHub auth
-    gh_auth = False
-    if has_command("gh"):
-        from ..utils.run import run_quiet
-        result = run_quiet(["gh", "auth", "status"])
-        gh_auth = result.returncode == 0
+    gh_auth = gh_proc is not None and gh_proc.wait() == 0
     checks.append(("GitHub auth", gh_auth, "gh auth login"))
 
     # Print results
@@ -245,21 +269,18 @@ def doctor():
         dim("  No files in manifest")
     else:
         issues = 0
+        dotfiles_path = cfg.dotfiles_path
         for entry in entries:
-            source_abs = cfg.dotfiles_path / entry.source
+            source_abs = dotfiles_path / entry.source
 
             if not source_abs.exists():
                 issues += 1
-                continue
-
-            if entry.type == "symlink":
-                status = check_symlink(source_abs, entry.dest)
-            else:
-                status = check_copy(source_abs, entry.dest)
-
-            if status != "ok":
+            elif _CHECKERS.get(entry.type, check_copy)(source_abs, entry.dest) != "ok":
                 issues += 1
 
+            if issues and fail_fast:
+                break
+
         if issues:
             warning(f"  {issues} file(s) need attention")
             info("  Run 'dotfiles diff' for details")
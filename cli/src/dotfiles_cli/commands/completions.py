@@ -1,4 +1,9 @@
-"""Shell completions for dotfiles-cli."""
+"""Shell completions for dotfiles-cli.
+
+The generated scripts are fully static: every candidate is baked into the
+`complete`/`compgen` tables below, so the shell never shells out to
+`dotfiles` (and never pays a Python startup) while completing.
+"""
 
 from pathlib import Path
 
@@ -144,21 +149,41 @@ _dotfiles "$@"
 '''
 
 
+# Static registry: shell -> (script, install path, post-install hint).
+# The command tree is fixed at build time, so nothing is introspected at
+# runtime - generate/install are pure table lookups.
+_COMPLETIONS = {
+    "fish": (
+        FISH_COMPLETION,
+        ".config/fish/completions/dotfiles.fish",
+        None,
+    ),
+    "bash": (
+        BASH_COMPLETION,
+        ".local/share/bash-completion/completions/dotfiles",
+        "Add to ~/.bashrc: source ~/.local/share/bash-completion/completions/dotfiles",
+    ),
+    "zsh": (
+        ZSH_COMPLETION,
+        ".zsh/completions/_dotfiles",
+        "Add to ~/.zshrc: fpath=(~/.zsh/completions $fpath)",
+    ),
+}
+
+
 def generate(shell: str = "fish"):
     """Generate shell completions.
 
     Args:
         shell: Shell type (fish, bash, zsh)
     """
-    if shell == "fish":
-        print(FISH_COMPLETION)
-    elif shell == "bash":
-        print(BASH_COMPLETION)
-    elif shell == "zsh":
-        print(ZSH_COMPLETION)
-    else:
+    entry = _COMPLETIONS.get(shell)
+    if entry is None:
         print(f"Unknown shell: {shell}")
-        print("Supported: fish, bash, zsh")
+        print(f"Supported: {', '.join(_COMPLETIONS)}")
+        return
+
+    print(entry[0])
 
 
 def install(shell: str = "fish"):
@@ -167,31 +192,18 @@ def install(shell: str = "fish"):
     Args:
         shell: Shell type (fish, bash, zsh)
     """
+    entry = _COMPLETIONS.get(shell)
+    if entry is None:
+        print(f"Unknown shell: {shell}")
+        print(f"Supported: {', '.join(_COMPLETIONS)}")
+        return
+
     header(f"Installing {shell} completions")
 
-    if shell == "fish":
-        comp_dir = Path.home() / ".config/fish/completions"
-        comp_dir.mkdir(parents=True, exist_ok=True)
-        comp_file = comp_dir / "dotfiles.fish"
-        comp_file.write_text(FISH_COMPLETION)
-        success(f"Installed: {comp_file}")
-
-    elif shell == "bash":
-        comp_dir = Path.home() / ".local/share/bash-completion/completions"
-        comp_dir.mkdir(parents=True, exist_ok=True)
-        comp_file = comp_dir / "dotfiles"
-        comp_file.write_text(BASH_COMPLETION)
-        success(f"Installed: {comp_file}")
-        info("Add to ~/.bashrc: source ~/.local/share/bash-completion/completions/dotfiles")
-
-    elif shell == "zsh":
-        comp_dir = Path.home() / ".zsh/completions"
-        comp_dir.mkdir(parents=True, exist_ok=True)
-        comp_file = comp_dir / "_dotfiles"
-        comp_file.write_text(ZSH_COMPLETION)
-        success(f"Installed: {comp_file}")
-        info("Add to ~/.zshrc: fpath=(~/.zsh/completions $fpath)")
-
-    else:
-        print(f"Unknown shell: {shell}")
-        print("Supported: fish, bash, zsh")
+    script, rel_path, hint = entry
+    comp_file = Path.home() / rel_path
+    comp_file.parent.mkdir(parents=True, exist_ok=True)
+    comp_file.write_text(script)
+    success(f"Installed: {comp_file}")
+    if hint:
+        info(hint)
@@ -4,6 +4,7 @@ from typing import Optional
 
 from ..utils.console import success, error, info, header
 from ..utils.run import run, run_quiet, has_command
+from ..utils.git import find_repo_root
 
 
 def init_hub(name: str, public: bool = False):
@@ -28,8 +29,7 @@ def init_hub(name: str, public: bool = False):
     header(f"Creating {'public' if public else 'private'} repo: {name}")
 
     # Initialize git if needed
-    result = run_quiet(["git", "rev-parse", "--is-inside-work-tree"])
-    if result.returncode != 0:
+    if find_repo_root() is None:
         info("Initializing git...")
         run(["git", "init"], check=False)
 
@@ -71,20 +71,18 @@ def quick(message: str = "minor fix"):
     Args:
         message: Commit message (default: "minor fix")
     """
-    # Check if in git repo
-    result = run_quiet(["git", "rev-parse", "--is-inside-work-tree"])
-    if result.returncode != 0:
+    # Check if in git repo (no subprocess needed)
+    if find_repo_root() is None:
         error("Not in a git repository")
         return False
 
-    run(["git", "add", "."], check=False)
-
-    # Check if there are changes
+    # Check for changes (including untracked) before staging anything
     result = run_quiet(["git", "status", "--porcelain"])
     if not result.stdout.strip():
         info("No changes to commit")
         return True
 
+    run(["git", "add", "."], check=False)
     run(["git", "commit", "-m", message], check=False)
     run(["git", "push"], check=False)
 
@@ -1,5 +1,6 @@
 """Pre/post hooks for dotfiles operations."""
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -27,27 +28,30 @@ def run_hook(name: str, phase: str = "pre") -> bool:
     hooks_dir = get_hooks_dir()
     hook_name = f"{phase}-{name}"
 
-    # Check for hook script
-    for ext in ["", ".sh", ".fish", ".py"]:
-        hook_path = hooks_dir / f"{hook_name}{ext}"
-        if hook_path.exists() and hook_path.is_file():
-            return _execute_hook(hook_path, hook_name)
+    # One directory scan instead of a stat per candidate extension
+    try:
+        with os.scandir(hooks_dir) as it:
+            present = {e.name for e in it if e.is_file()}
+    except FileNotFoundError:
+        return True  # No hooks directory, that's OK
+
+    for ext in ("", ".sh", ".fish", ".py"):
+        candidate = f"{hook_name}{ext}"
+        if candidate in present:
+            return _execute_hook(hooks_dir / candidate, hook_name)
 
     return True  # No hook found, that's OK
 
 
+# Interpreter by hook suffix; anything else runs under bash
+_INTERP = {".fish": ["fish"], ".py": ["python3"]}
+
+
 def _execute_hook(hook_path: Path, hook_name: str) -> bool:
     """Execute a hook script."""
     dim(f"  Running hook: {hook_name}")
 
-    # Determine interpreter
-    suffix = hook_path.suffix
-    if suffix == ".fish":
-        interpreter = ["fish"]
-    elif suffix == ".py":
-        interpreter = ["python3"]
-    else:
-        interpreter = ["bash"]
+    interpreter = _INTERP.get(hook_path.suffix, ["bash"])
 
     result = run(interpreter + [str(hook_path)], check=False)
 
@@ -62,14 +66,18 @@ def list_hooks():
     """List all available hooks."""
     hooks_dir = get_hooks_dir()
 
-    if not hooks_dir.exists():
+    # One readdir; DirEntry.is_file() answers from the scan without an
+    # extra stat per entry on most platforms
+    try:
+        with os.scandir(hooks_dir) as it:
+            hooks = sorted(
+                e.name for e in it if e.is_file() and not e.name.startswith(".")
+            )
+    except FileNotFoundError:
         info("No hooks directory found")
         info(f"Create hooks in: {hooks_dir}")
         return
 
-    hooks = sorted(hooks_dir.glob("*"))
-    hooks = [h for h in hooks if h.is_file() and not h.name.startswith(".")]
-
     if not hooks:
         info("No hooks found")
         info(f"Create hooks in: {hooks_dir}")
@@ -78,7 +86,7 @@ def list_hooks():
 
     info("Available hooks:")
     for hook in hooks:
-        print(f"  {hook.name}")
+        print(f"  {hook}")
 
 
 def create_hook(name: str, phase: str = "pre"):
@@ -42,13 +42,13 @@ def install_tool():
 
 def _run_pkgmanager(*args):
     """Run pkgmanager with given arguments."""
-    import os
     cfg = get_config()
 
-    env = os.environ.copy()
-    env["PACKAGE_CONFIG"] = str(cfg.packages_yaml)
-
-    run(["pkgmanager", *args], check=False)
+    run(
+        ["pkgmanager", *args],
+        check=False,
+        extra_env={"PACKAGE_CONFIG": str(cfg.packages_yaml)},
+    )
 
 
 def init(types: Optional[str] = None):
@@ -1,5 +1,7 @@
 """Platform-specific commands."""
 
+from pathlib import Path
+
 from ..config import get_config
 from ..utils.console import success, error, warning, info, header, dim
 from ..utils.run import run, has_command
@@ -9,50 +11,73 @@ def setup():
     """Run platform-specific setup."""
     cfg = get_config()
 
-    if cfg.is_macos:
-        _setup_macos(cfg)
-    elif cfg.is_linux:
-        _setup_linux(cfg)
-    else:
+    setup_fn = _SETUP.get(cfg.platform)
+    if setup_fn is None:
         warning(f"No platform setup for: {cfg.platform}")
+        return
+    setup_fn(cfg)
 
 
 def update():
     """Update platform packages."""
     cfg = get_config()
 
-    if cfg.is_macos:
-        _update_macos()
-    elif cfg.is_linux:
-        _update_linux()
-    else:
+    update_fn = _UPDATE.get(cfg.platform)
+    if update_fn is None:
         warning(f"No platform update for: {cfg.platform}")
+        return
+    update_fn()
+
+
+HOMEBREW_INSTALL_URL = "https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh"
+
+
+def install_homebrew():
+    """Download the Homebrew installer and run it with bash directly.
+
+    Avoids the sh -> bash -> curl process chain (and its quoting) by
+    fetching the script in-process and handing bash a plain file path.
+    """
+    import shutil
+    import tempfile
+    import urllib.request
+
+    info("Installing Homebrew...")
+    try:
+        with urllib.request.urlopen(HOMEBREW_INSTALL_URL) as response, \
+                tempfile.NamedTemporaryFile("wb", suffix=".sh", delete=False) as f:
+            shutil.copyfileobj(response, f)
+            script = f.name
+    except OSError as e:
+        error(f"Failed to download Homebrew installer: {e}")
+        return
+
+    run(["bash", script], check=False)
 
 
 def _setup_macos(cfg):
     """macOS-specific setup."""
     header("macOS Setup")
 
+    # Build the platform/mac paths once
+    mac_dir = cfg.platform_path / "mac"
+    brewfile = mac_dir / "Brewfile"
+    mackup_cfg = mac_dir / "mackup" / ".mackup.cfg"
+
     # Homebrew
     if not has_command("brew"):
-        info("Installing Homebrew...")
-        run(
-            ["sh", "-c", '/bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"'],
-            check=False
-        )
+        install_homebrew()
     else:
         dim("  Homebrew already installed")
 
     # Brewfile
-    brewfile = cfg.platform_path / "mac" / "Brewfile"
-    if brewfile.exists():
+    if brewfile.is_file():
         info("Installing from Brewfile...")
         run(["brew", "bundle", f"--file={brewfile}"], check=False)
         success("Brewfile installed")
 
     # Mackup restore
-    mackup_cfg = cfg.platform_path / "mac" / "mackup" / ".mackup.cfg"
-    if mackup_cfg.exists() and has_command("mackup"):
+    if has_command("mackup") and mackup_cfg.is_file():
         info("Restoring Mackup settings...")
         run(["mackup", "restore", "-f"], check=False)
         success("Mackup restored")
@@ -64,6 +89,30 @@ def _setup_linux(cfg):
     dim("  No additional setup configured")
 
 
+def _brew_metadata_fresh() -> bool:
+    """Check whether brew's tap metadata was fetched recently.
+
+    brew update re-fetches taps over the network every time; if the last
+    fetch is younger than DOTFILES_BREW_UPDATE_TTL seconds (default 3600)
+    we can skip it and go straight to upgrade.
+    """
+    import os
+    import time
+
+    result = run(["brew", "--prefix"], check=False, capture=True, quiet=True)
+    if result.returncode != 0:
+        return False
+
+    fetch_head = Path(result.stdout.strip()) / "Homebrew" / ".git" / "FETCH_HEAD"
+    try:
+        age = time.time() - fetch_head.stat().st_mtime
+    except OSError:
+        return False
+
+    ttl = int(os.environ.get("DOTFILES_BREW_UPDATE_TTL", "3600"))
+    return age < ttl
+
+
 def _update_macos():
     """Update macOS packages."""
     header("Updating macOS packages")
@@ -72,16 +121,25 @@ def _update_macos():
         error("Homebrew not installed")
         return
 
-    info("Updating Homebrew...")
-    run(["brew", "update"], check=False)
+    if _brew_metadata_fresh():
+        dim("  brew update skipped (metadata is fresh)")
+    else:
+        info("Updating Homebrew...")
+        run(["brew", "update"], check=False)
 
     info("Upgrading packages...")
     run(["brew", "upgrade"], check=False)
 
+    # Cleanup only reclaims disk space and cannot fail the update; start
+    # it in the background and report while it runs. The upgrade has
+    # already returned, so there is no brew lock contention.
+    import subprocess
+
     info("Cleaning up...")
-    run(["brew", "cleanup"], check=False)
+    cleanup = subprocess.Popen(["brew", "cleanup"])
 
     success("macOS packages updated")
+    cleanup.wait()
 
 
 def _update_linux():
@@ -90,9 +148,41 @@ def _update_linux():
     dim("  No package manager configured")
 
 
+# Platform dispatch, keyed on a single cfg.platform read; supporting a
+# new OS is one entry here instead of another elif branch
+_SETUP = {"darwin": _setup_macos, "linux": _setup_linux}
+_UPDATE = {"darwin": _update_macos, "linux": _update_linux}
+
+
+# Strips the CR and NUL bytes wsl.exe/cmd.exe leave in their output,
+# in one pass instead of chained str.replace allocations
+_WIN_CLEAN = str.maketrans("", "", "\r\x00")
+
+
 # Windows-specific commands (WSL helpers)
 def win_user():
     """Print Windows user profile path converted to WSL path."""
+    import os
+
+    # Cheap lookups first: spawning cmd.exe from WSL cold-starts a Win32
+    # process (~100-300 ms), so only fall back to interop when needed
+
+    # (a) USERPROFILE is passed through when launched from Windows Terminal
+    profile = os.environ.get("USERPROFILE")
+    if profile and has_command("wslpath"):
+        converted = run(["wslpath", profile], check=False, capture=True, quiet=True)
+        if converted.returncode == 0:
+            print(converted.stdout.strip())
+            return
+
+    # (b) The standard profile location for the current user
+    user = os.environ.get("USER", "")
+    guess = Path("/mnt/c/Users") / user
+    if user and guess.is_dir():
+        print(guess)
+        return
+
+    # (c) Interop fallback: ask cmd.exe, convert with wslpath
     if not has_command("cmd.exe") or not has_command("wslpath"):
         error("cmd.exe or wslpath not found")
         return
@@ -103,7 +193,7 @@ def win_user():
         capture=True,
         quiet=True,
     )
-    path = result.stdout.replace("\r", "").strip()
+    path = result.stdout.rstrip("\r\n ")
     if not path:
         error("Failed to resolve Windows user profile")
         return
@@ -132,7 +222,7 @@ def win_dist():
         error("Failed to list running WSL distributions")
         return
 
-    output = result.stdout.replace("\r", "").replace("\0", "").strip()
+    output = result.stdout.translate(_WIN_CLEAN).strip()
     if output:
         print(output)
 
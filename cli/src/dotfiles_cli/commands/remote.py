@@ -1,20 +1,311 @@
 """Remote deployment of dotfiles via SSH."""
 
+import atexit
+import functools
+import os
+import sys
+import tempfile
 from pathlib import Path
 from typing import Optional
 
-from ..config import get_config
+from ..config import cache_dir, get_config
 from ..utils.console import success, error, warning, info, header, dim
-from ..utils.run import run, run_quiet, has_command
+from ..utils.run import run, run_quiet, has_command, have_command_var
 
 
-def deploy(host: str, path: str = "~/dotfiles", bootstrap: bool = False):
+# OpenSSH connection multiplexing: the first connection per host starts a
+# background master, and every later ssh/rsync call in the same deploy
+# reuses it over a UNIX socket instead of paying a fresh handshake.
+# ControlMaster is POSIX-only.
+if sys.platform != "win32":
+    SSH_MUX_OPTS = [
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={tempfile.gettempdir()}/dotfiles-ssh-%C",
+        "-o", "ControlPersist=60s",
+    ]
+else:
+    SSH_MUX_OPTS = []
+
+
+def _ssh_cmd(*args: str) -> list[str]:
+    """Build an ssh argv with multiplexing options."""
+    return ["ssh", *SSH_MUX_OPTS, *args]
+
+
+# Patterns never shipped to (or pulled from) a remote
+RSYNC_EXCLUDES = (".git", "public", "__pycache__", "*.pyc", ".venv")
+
+
+@functools.lru_cache(maxsize=None)
+def _exclude_file(*extra: str) -> str:
+    """Write the rsync exclude list to a temp file, once per pattern set.
+
+    A single --exclude-from keeps the argv short no matter how many
+    patterns accumulate, and is where user patterns from
+    <dotfiles>/.dotfiles-rsyncignore get layered in.
+    """
+    lines = [*RSYNC_EXCLUDES, *extra]
+    ignore = get_config().dotfiles_path / ".dotfiles-rsyncignore"
+    try:
+        lines += [l for l in ignore.read_text().splitlines() if l.strip()]
+    except OSError:
+        pass
+
+    tmp = tempfile.NamedTemporaryFile("w", suffix=".rsync-excludes", delete=False)
+    tmp.write("\n".join(lines) + "\n")
+    tmp.close()
+    atexit.register(os.unlink, tmp.name)
+    return tmp.name
+
+
+@functools.lru_cache(maxsize=1)
+def _rsync_flags() -> tuple[str, ...]:
+    """Transfer flags for rsync, probed once per process.
+
+    rsync >= 3.2 supports zstd compression (roughly half the CPU of the
+    default zlib at a similar ratio), and --inplace --partial avoids
+    rewriting whole files for small dotfile edits. Older rsync falls
+    back to the plain -avz behavior.
+    """
+    try:
+        result = run_quiet(["rsync", "--version"])
+    except FileNotFoundError:
+        return ("-avz",)
+    if "zstd" in (result.stdout or ""):
+        return (
+            "-a", "--inplace", "--partial",
+            "-z", "--compress-choice=zstd",
+            "--info=progress2",
+        )
+    return ("-avz",)
+
+
+def _rsync_transfer(args: list[str], quiet: bool = False):
+    """Run an rsync transfer, falling back to plain -avz on failure.
+
+    _rsync_flags only probes the local rsync, but
+    --compress-choice=zstd must be supported by both ends; a remote
+    rsync older than 3.2 rejects it where baseline -avz works. When the
+    probed flag set fails and was not already the baseline, the
+    transfer is retried once with -avz.
+    """
+    flags = _rsync_flags()
+    runner = run_quiet if quiet else functools.partial(run, check=False)
+    result = runner(["rsync", *flags, *args])
+    if result.returncode != 0 and flags != ("-avz",):
+        result = runner(["rsync", "-avz", *args])
+    return result
+
+
+def _rsync_ssh() -> list[str]:
+    """rsync -e value that routes its transport through the mux socket."""
+    if not SSH_MUX_OPTS:
+        return []
+    return ["-e", " ".join(["ssh", *SSH_MUX_OPTS])]
+
+
+def _remote_prepare(host: str, path: str) -> Optional[str]:
+    """Probe the host and create the deploy directory in one SSH session.
+
+    The liveness check and mkdir used to be two separate connections;
+    sentinel markers in the combined output tell us which phase failed.
+
+    Returns:
+        None on success, or a short failure reason
+    """
+    script = f"echo __probe__ && mkdir -p {path} && echo __mkdir__"
+    result = run_quiet(_ssh_cmd("-o", "ConnectTimeout=5", host, script))
+    out = result.stdout or ""
+    if "__probe__" not in out:
+        return "cannot connect"
+    if result.returncode != 0 or "__mkdir__" not in out:
+        return f"failed to create {path}"
+    return None
+
+
+def _build_wheel_cache(cfg) -> bool:
+    """Build the CLI wheel into the user cache for offline remote installs.
+
+    Skipped when the existing wheel is newer than every CLI source file,
+    so repeated deploys do not pay the build. Built outside the repo so
+    deploys never leave binary artifacts in the tracked tree; they are
+    shipped to the remote's .dotfiles/_wheels by _ship_wheels.
+
+    Returns:
+        True when a wheel is available to ship
+    """
+    cli_src = cfg.dotfiles_internal / "dotfiles-cli"
+    wheels = cache_dir() / "wheels"
+
+    if not has_command("uv") or not (cli_src / "pyproject.toml").exists():
+        return False
+
+    if _wheel_fresh(wheels, cli_src):
+        return True
+
+    result = run_quiet(
+        ["uv", "build", "--wheel", "--out-dir", str(wheels), str(cli_src)]
+    )
+    return result.returncode == 0 and any(wheels.glob("*.whl"))
+
+
+def _wheel_fresh(wheels: Path, cli_src: Path) -> bool:
+    """Check whether the cached wheel is newer than all CLI sources."""
+    try:
+        wheel_mtime = max(w.stat().st_mtime for w in wheels.glob("*.whl"))
+    except (OSError, ValueError):
+        return False
+
+    skip = {"__pycache__", ".venv", "dist"}
+    for root, dirs, files in os.walk(cli_src):
+        dirs[:] = [d for d in dirs if d not in skip]
+        for name in files:
+            try:
+                if os.path.getmtime(os.path.join(root, name)) > wheel_mtime:
+                    return False
+            except OSError:
+                return False
+    return True
+
+
+def _ship_wheels(host: str, path: str) -> bool:
+    """Copy the locally built wheels to the remote's .dotfiles/_wheels.
+
+    Runs after the main tree sync (whose --delete clears any previous
+    wheel directory), so the remote .dotfiles parent already exists.
+    """
+    result = _rsync_transfer([
+        *_rsync_ssh(),
+        f"{cache_dir() / 'wheels'}/",
+        f"{host}:{path}/.dotfiles/_wheels/"
+    ], quiet=True)
+    return result.returncode == 0
+
+
+def _install_cmd(path: str, wheel_available: bool) -> str:
+    """Remote command installing the CLI, offline when a wheel was shipped.
+
+    The wheel cache only holds the dotfiles-cli wheel itself, so the
+    --no-index install fails on hosts that still need the dependencies
+    fetched; the chain falls through to the online source install that
+    plain deploys use, rather than leaving the remote without a CLI.
+    """
+    source_install = (
+        f"uv tool install .dotfiles/dotfiles-cli --force 2>/dev/null "
+        f"|| pip install --user .dotfiles/dotfiles-cli"
+    )
+    if wheel_available:
+        return (
+            f"cd {path} && uv tool install --no-index "
+            f"--find-links .dotfiles/_wheels dotfiles-cli --force 2>/dev/null "
+            f"|| pip install --user --no-index --find-links .dotfiles/_wheels "
+            f"dotfiles-cli 2>/dev/null "
+            f"|| {source_install}"
+        )
+    return f"cd {path} && {source_install}"
+
+
+# Tools bootstrap cares about, probed on the remote in one SSH session
+REMOTE_PROBE_TOOLS = ("uv", "pip", "git", "rsync", "brew", "cargo", "fish")
+
+
+def _probe_remote(host: str) -> dict[str, bool]:
+    """Check all REMOTE_PROBE_TOOLS on the remote in a single session.
+
+    Returns:
+        Mapping of tool name to availability (empty if the probe failed)
+    """
+    script = "; ".join(
+        f"command -v {tool} >/dev/null 2>&1 && echo HAVE:{tool} || echo MISS:{tool}"
+        for tool in REMOTE_PROBE_TOOLS
+    )
+    result = run_quiet(_ssh_cmd(host, script))
+    if result.returncode != 0:
+        return {}
+
+    found = {}
+    for line in (result.stdout or "").splitlines():
+        if line.startswith("HAVE:"):
+            found[line[5:]] = True
+        elif line.startswith("MISS:"):
+            found[line[5:]] = False
+    return found
+
+
+def _bootstrap_cmd(path: str, capabilities: dict[str, bool]) -> str:
+    """Bootstrap command line with pre-probed capabilities as env overrides.
+
+    The remote CLI's has_command honors DOTFILES_HAVE_<NAME> overrides,
+    so bootstrap skips its own per-tool PATH probes entirely.
+    """
+    overrides = " ".join(
+        f"{have_command_var(tool)}={'1' if present else '0'}"
+        for tool, present in sorted(capabilities.items())
+    )
+    prefix = f"{overrides} " if overrides else ""
+    return f"export DOTFILES={path} && {prefix}dotfiles bootstrap"
+
+
+def _tree_fingerprint(cfg) -> Optional[str]:
+    """Fingerprint of the dotfiles tree, or None when it cannot be trusted.
+
+    The HEAD commit hash identifies a clean tree exactly. A dirty tree
+    returns None: git status cannot see further edits to an
+    already-modified file, so skipping on it would miss real changes.
+    """
+    status = run_quiet(["git", "-C", str(cfg.dotfiles_path), "status", "--porcelain"])
+    if status.returncode != 0 or status.stdout.strip():
+        return None
+
+    head = run_quiet(["git", "-C", str(cfg.dotfiles_path), "rev-parse", "HEAD"])
+    if head.returncode != 0:
+        return None
+    return head.stdout.strip()
+
+
+def _fingerprint_file(host: str, path: str) -> Path:
+    """Cache file recording the last tree fingerprint deployed to host:path."""
+    import hashlib
+
+    tag = hashlib.blake2b(f"{host}:{path}".encode(), digest_size=8).hexdigest()
+    return cache_dir() / f"deploy-{tag}.fp"
+
+
+def _record_deploy(host: str, path: str, fingerprint: Optional[str]):
+    """Persist the fingerprint just deployed to host:path."""
+    if fingerprint is None:
+        return
+    fp_file = _fingerprint_file(host, path)
+    try:
+        fp_file.parent.mkdir(parents=True, exist_ok=True)
+        fp_file.write_text(fingerprint)
+    except OSError:
+        pass
+
+
+def _already_deployed(host: str, path: str, fingerprint: Optional[str]) -> bool:
+    """Check whether host:path already has this exact tree."""
+    if fingerprint is None:
+        return False
+    try:
+        return _fingerprint_file(host, path).read_text() == fingerprint
+    except OSError:
+        return False
+
+
+def deploy(
+    host: str,
+    path: str = "~/dotfiles",
+    bootstrap: bool = False,
+    force: bool = False,
+):
     """Deploy dotfiles to a remote host via SSH.
 
     Args:
         host: SSH host (from ~/.ssh/config or user@hostname)
         path: Remote path for dotfiles (default: ~/dotfiles)
         bootstrap: Run bootstrap after deploy
+        force: Deploy even when the tree fingerprint matches the last deploy
     """
     cfg = get_config()
 
@@ -24,44 +315,60 @@ def deploy(host: str, path: str = "~/dotfiles", bootstrap: bool = False):
 
     header(f"Deploying to {host}")
 
-    # Test SSH connection
-    info("Testing SSH connection...")
-    result = run_quiet(["ssh", "-o", "ConnectTimeout=5", host, "echo ok"])
-    if result.returncode != 0:
-        error(f"Cannot connect to {host}")
+    fingerprint = _tree_fingerprint(cfg)
+    if not force and _already_deployed(host, path, fingerprint):
+        # The fingerprint only attests tree content, so an explicit
+        # --bootstrap still runs even when the sync is skipped
+        success(f"{host}:{path} already has this tree (use --force to redeploy)")
+        if bootstrap:
+            info("Running bootstrap on remote...")
+            run(_ssh_cmd("-t", host, _bootstrap_cmd(path, _probe_remote(host))), check=False)
+        return True
+
+    # Test SSH connection and create the remote directory in one session
+    info(f"Preparing {host}:{path}...")
+    failure = _remote_prepare(host, path)
+    if failure is not None:
+        error(f"{host}: {failure}")
         return False
 
-    # Create remote directory
-    info(f"Creating remote directory: {path}")
-    run_quiet(["ssh", host, f"mkdir -p {path}"])
+    # Build the CLI wheel locally so the remote install is offline
+    wheel_available = _build_wheel_cache(cfg)
 
     # Sync dotfiles
     info("Syncing dotfiles...")
-    rsync_args = [
-        "rsync", "-avz", "--delete",
-        "--exclude", ".git",
-        "--exclude", "public",
-        "--exclude", "__pycache__",
-        "--exclude", "*.pyc",
-        "--exclude", ".venv",
-        "--exclude", "backups",
+    result = _rsync_transfer([
+        "--delete",
+        *_rsync_ssh(),
+        f"--exclude-from={_exclude_file('backups')}",
         f"{cfg.dotfiles_path}/",
         f"{host}:{path}/"
-    ]
-
-    result = run(rsync_args, check=False)
+    ])
     if result.returncode != 0:
         error("rsync failed")
         return False
 
     success("Dotfiles synced")
 
-    # Install CLI on remote
+    # Wheels live in the user cache, not the synced tree
+    if wheel_available:
+        wheel_available = _ship_wheels(host, path)
+
+    # Install CLI on remote. Started as a background session so the
+    # capability probe for bootstrap (and the fingerprint write) overlap
+    # the install instead of queuing behind it.
+    import subprocess
+
     info("Installing dotfiles-cli on remote...")
-    install_cmd = f"cd {path} && uv tool install .dotfiles/dotfiles-cli --force 2>/dev/null || pip install --user .dotfiles/dotfiles-cli"
-    result = run_quiet(["ssh", host, install_cmd])
+    install_proc = subprocess.Popen(
+        _ssh_cmd(host, _install_cmd(path, wheel_available)),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
-    if result.returncode == 0:
+    capabilities = _probe_remote(host) if bootstrap else {}
+
+    if install_proc.wait() == 0:
         success("CLI installed on remote")
     else:
         warning("CLI installation may have failed (uv/pip might not be available)")
@@ -69,14 +376,97 @@ def deploy(host: str, path: str = "~/dotfiles", bootstrap: bool = False):
     # Run bootstrap if requested
     if bootstrap:
         info("Running bootstrap on remote...")
-        bootstrap_cmd = f"export DOTFILES={path} && dotfiles bootstrap"
-        run(["ssh", "-t", host, bootstrap_cmd], check=False)
+        run(_ssh_cmd("-t", host, _bootstrap_cmd(path, capabilities)), check=False)
 
+    _record_deploy(host, path, fingerprint)
     success(f"Deployed to {host}:{path}")
     info(f"SSH in and run: DOTFILES={path} dotfiles apply")
     return True
 
 
+def _deploy_one(
+    host: str, path: str, bootstrap: bool, cfg, wheel_available: bool = False
+) -> tuple[bool, str]:
+    """Deploy to a single host with all output captured (thread-safe).
+
+    Returns:
+        Tuple of (success, detail message)
+    """
+    failure = _remote_prepare(host, path)
+    if failure is not None:
+        return False, failure
+
+    result = _rsync_transfer([
+        "--delete",
+        *_rsync_ssh(),
+        f"--exclude-from={_exclude_file('backups')}",
+        f"{cfg.dotfiles_path}/",
+        f"{host}:{path}/"
+    ], quiet=True)
+    if result.returncode != 0:
+        return False, "rsync failed"
+
+    if wheel_available:
+        wheel_available = _ship_wheels(host, path)
+
+    run_quiet(_ssh_cmd(host, _install_cmd(path, wheel_available)))
+
+    if bootstrap:
+        result = run_quiet(_ssh_cmd(host, _bootstrap_cmd(path, _probe_remote(host))))
+        if result.returncode != 0:
+            return False, "deployed, but bootstrap failed"
+
+    return True, f"deployed to {host}:{path}"
+
+
+def deploy_many(hosts: list[str], path: str = "~/dotfiles", bootstrap: bool = False):
+    """Deploy dotfiles to several hosts in parallel.
+
+    Args:
+        hosts: SSH hosts to deploy to
+        path: Remote path for dotfiles (default: ~/dotfiles)
+        bootstrap: Run bootstrap after deploy
+
+    Concurrency is capped by DOTFILES_SSH_PARALLEL (default: 8).
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    cfg = get_config()
+
+    if not has_command("rsync"):
+        error("rsync not installed")
+        return False
+
+    header(f"Deploying to {len(hosts)} hosts")
+
+    # Built once here; the worker threads only ship and install it
+    wheel_available = _build_wheel_cache(cfg)
+
+    max_workers = min(len(hosts), int(os.environ.get("DOTFILES_SSH_PARALLEL", "8")))
+    failed = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(_deploy_one, host, path, bootstrap, cfg, wheel_available): host
+            for host in hosts
+        }
+        for future in as_completed(futures):
+            host = futures[future]
+            ok, detail = future.result()
+            if ok:
+                success(f"{host}: {detail}")
+            else:
+                error(f"{host}: {detail}")
+                failed.append(host)
+
+    print()
+    if failed:
+        error(f"{len(failed)} of {len(hosts)} hosts failed: {', '.join(failed)}")
+        return False
+
+    success(f"Deployed to all {len(hosts)} hosts")
+    return True
+
+
 def sync_from(host: str, path: str = "~/dotfiles"):
     """Sync dotfiles from a remote host.
 
@@ -93,25 +483,19 @@ def sync_from(host: str, path: str = "~/dotfiles"):
     header(f"Syncing from {host}")
 
     # Test SSH connection
-    result = run_quiet(["ssh", "-o", "ConnectTimeout=5", host, "echo ok"])
+    result = run_quiet(_ssh_cmd("-o", "ConnectTimeout=5", host, "echo ok"))
     if result.returncode != 0:
         error(f"Cannot connect to {host}")
         return False
 
     # Sync from remote
     info("Syncing dotfiles from remote...")
-    rsync_args = [
-        "rsync", "-avz",
-        "--exclude", ".git",
-        "--exclude", "public",
-        "--exclude", "__pycache__",
-        "--exclude", "*.pyc",
-        "--exclude", ".venv",
+    result = _rsync_transfer([
+        *_rsync_ssh(),
+        f"--exclude-from={_exclude_file()}",
         f"{host}:{path}/",
         f"{cfg.dotfiles_path}/"
-    ]
-
-    result = run(rsync_args, check=False)
+    ])
     if result.returncode != 0:
         error("rsync failed")
         return False
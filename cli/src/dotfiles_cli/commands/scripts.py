@@ -46,20 +46,26 @@ def run_script(name: str):
 
 def list_scripts():
     """List available scripts."""
+    import os
+
     cfg = get_config()
 
     header("Available scripts")
 
-    if not cfg.scripts_path.exists():
+    # One scandir pass: is_file comes from the readdir d_type, so no
+    # extra stat per entry like glob + Path.is_file would do
+    try:
+        with os.scandir(cfg.scripts_path) as it:
+            names = sorted(
+                e.name for e in it
+                if not e.name.startswith(".") and e.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
         info("No scripts directory found")
         return
 
-    scripts = sorted(cfg.scripts_path.glob("*"))
-    scripts = [s for s in scripts if s.is_file() and not s.name.startswith(".")]
-
-    if not scripts:
+    if not names:
         info("No scripts found")
         return
 
-    for script in scripts:
-        console.print(f"  {script.name}")
+    console.print("\n".join(f"  {name}" for name in names))
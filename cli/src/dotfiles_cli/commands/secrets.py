@@ -0,0 +1,171 @@
+"""Secrets commands: git-crypt wrapper."""
+
+from pathlib import Path
+from typing import Optional
+
+from ..config import get_config
+from ..utils.console import success, error, info, header, dim
+from ..utils.run import run, run_quiet, has_command
+
+
+def _check_git_crypt() -> bool:
+    """Check if git-crypt is available."""
+    if not has_command("git-crypt"):
+        error("git-crypt not installed")
+        info("Install with: brew install git-crypt")
+        return False
+    return True
+
+
+def init():
+    """Initialize git-crypt in the repo."""
+    if not _check_git_crypt():
+        return False
+
+    cfg = get_config()
+
+    git_crypt_dir = cfg.dotfiles_path / ".git" / "git-crypt"
+    if git_crypt_dir.exists():
+        info("git-crypt already initialized")
+        return True
+
+    header("Initializing git-crypt")
+    result = run(["git-crypt", "init"], cwd=cfg.dotfiles_path, check=False)
+    if result.returncode != 0:
+        error("git-crypt init failed")
+        return False
+
+    success("git-crypt initialized")
+    info("Add encryption patterns with: dotfiles secrets add-pattern '<glob>'")
+    return True
+
+
+def unlock(key: Optional[str] = None):
+    """Unlock secrets with git-crypt key.
+
+    Args:
+        key: Path to key file (default: configured key location)
+    """
+    if not _check_git_crypt():
+        return False
+
+    cfg = get_config()
+    key_path = Path(key).expanduser() if key else cfg.git_crypt_key
+
+    if not key_path.exists():
+        error(f"Key not found: {key_path}")
+        return False
+
+    result = run(
+        ["git-crypt", "unlock", str(key_path)],
+        cwd=cfg.dotfiles_path,
+        check=False,
+    )
+    if result.returncode != 0:
+        error("git-crypt unlock failed")
+        return False
+
+    success("Secrets unlocked")
+    return True
+
+
+def lock():
+    """Lock secrets (re-encrypt locally)."""
+    if not _check_git_crypt():
+        return False
+
+    cfg = get_config()
+
+    result = run(["git-crypt", "lock"], cwd=cfg.dotfiles_path, check=False)
+    if result.returncode != 0:
+        error("git-crypt lock failed")
+        return False
+
+    success("Secrets locked")
+    return True
+
+
+def status():
+    """Show git-crypt status."""
+    if not _check_git_crypt():
+        return False
+
+    cfg = get_config()
+    run(["git-crypt", "status"], cwd=cfg.dotfiles_path, check=False)
+    return True
+
+
+def export_key(output: Optional[str] = None):
+    """Export git-crypt key for backup.
+
+    Args:
+        output: Output path (default: configured key location)
+    """
+    if not _check_git_crypt():
+        return False
+
+    cfg = get_config()
+    out_path = Path(output).expanduser() if output else cfg.git_crypt_key
+
+    result = run(
+        ["git-crypt", "export-key", str(out_path)],
+        cwd=cfg.dotfiles_path,
+        check=False,
+    )
+    if result.returncode != 0:
+        error("Failed to export key")
+        return False
+
+    out_path.chmod(0o600)
+    success(f"Key exported to: {out_path}")
+    info("Keep this file safe - it decrypts your secrets")
+    return True
+
+
+def add_pattern(pattern: str):
+    """Add encryption pattern to .gitattributes.
+
+    Args:
+        pattern: Glob pattern to encrypt (e.g., secrets/**)
+    """
+    cfg = get_config()
+    gitattributes = cfg.dotfiles_path / ".gitattributes"
+
+    line = f"{pattern} filter=git-crypt diff=git-crypt\n"
+
+    if gitattributes.exists():
+        existing = gitattributes.read_text()
+        if line in existing:
+            info(f"Pattern already present: {pattern}")
+            return True
+        with open(gitattributes, "a") as f:
+            f.write(line)
+    else:
+        gitattributes.write_text(line)
+
+    success(f"Added pattern: {pattern}")
+    return True
+
+
+def list_encrypted():
+    """List all encrypted files."""
+    if not _check_git_crypt():
+        return False
+
+    cfg = get_config()
+
+    result = run_quiet(["git-crypt", "status", "-e"], cwd=cfg.dotfiles_path)
+    if result.returncode != 0:
+        error("git-crypt status failed (is git-crypt initialized?)")
+        return False
+
+    output = result.stdout.strip()
+    if not output:
+        info("No encrypted files")
+        return True
+
+    info("Encrypted files:")
+    for line in output.split("\n"):
+        # Format: "    encrypted: path/to/file"
+        dim(f"  {line.split(':', 1)[-1].strip()}")
+    return True
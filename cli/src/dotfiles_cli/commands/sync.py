@@ -2,9 +2,14 @@
 
 from pathlib import Path
 from typing import Optional
+import datetime
+import os
 import shutil
+import stat
 import subprocess
 
+import yaml
+
 from ..config import get_config
 from ..files.manifest import Manifest
 from ..files.linker import create_symlink, check_symlink
@@ -21,6 +26,12 @@ from ..utils.console import (
 )
 from ..utils import git
 
+try:
+    # libyaml-backed parser/emitter when PyYAML was built against it
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 
 # Common dotfiles to look for when importing
 COMMON_DOTFILES = [
@@ -59,8 +70,6 @@ COMMON_DOTFILES = [
 
 def apply(force: bool = False, dry_run: bool = False):
     """Apply dotfiles to system (create symlinks/copies)."""
-    from datetime import datetime
-
     cfg = get_config()
     manifest = Manifest.load(cfg.files_yaml)
 
@@ -74,7 +83,7 @@ def apply(force: bool = False, dry_run: bool = False):
     # Create backup directory if force mode
     backup_dir = None
     if force and not dry_run:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_dir = cfg.dotfiles_path / "backups" / f"pre-apply-{timestamp}"
         backup_dir.mkdir(parents=True, exist_ok=True)
 
@@ -136,8 +145,47 @@ def apply(force: bool = False, dry_run: bool = False):
                 backup_dir.rmdir()  # Remove empty backup dir
 
 
+def _files_equal(a: Path, b: Path) -> bool:
+    """Compare two files without loading either fully into memory.
+
+    Size mismatch short-circuits before any reads; otherwise both are
+    streamed in 64 KiB chunks with early exit on the first difference.
+    """
+    try:
+        if a.stat().st_size != b.stat().st_size:
+            return False
+        with open(a, "rb") as fa, open(b, "rb") as fb:
+            while True:
+                chunk_a = fa.read(65536)
+                if chunk_a != fb.read(65536):
+                    return False
+                if not chunk_a:
+                    return True
+    except OSError:
+        return False
+
+
+def _probe(p) -> tuple[bool, int]:
+    """One lstat instead of the exists/is_symlink/is_dir stat triple.
+
+    Returns (exists, st_mode); callers classify with the stat.S_IS*
+    macros. Missing paths come back as (False, 0).
+    """
+    try:
+        return True, os.lstat(p).st_mode
+    except OSError:
+        return False, 0
+
+
+def _io_workers(n_tasks: int) -> int:
+    """Worker count for parallel per-file I/O (copies release the GIL)."""
+    return max(1, min(8, (os.cpu_count() or 1) * 2, n_tasks))
+
+
 def collect(dry_run: bool = False):
     """Collect changes from system back to dotfiles repo (reverse of apply)."""
+    from concurrent.futures import ThreadPoolExecutor
+
     cfg = get_config()
     manifest = Manifest.load(cfg.files_yaml)
 
@@ -148,54 +196,62 @@ def collect(dry_run: bool = False):
     header("Collecting files")
     entries = manifest.for_platform(cfg.platform)
 
-    collected = 0
-    skipped = 0
-
-    for entry in entries:
+    def _collect_entry(entry) -> tuple:
+        """Process one entry; returns (status, line) for the main thread."""
         source_abs = cfg.dotfiles_path / entry.source
         dest_abs = Path.home() / entry.dest
         dest_display = f"~/{entry.dest}"
 
-        if not dest_abs.exists():
-            dim(f"  {dest_display} - not found, skipping")
-            skipped += 1
-            continue
+        dest_exists, dest_mode = _probe(dest_abs)
+        if not dest_exists:
+            return "skipped", f"  {dest_display} - not found, skipping"
 
         # Skip symlinks - they already point to repo
-        if dest_abs.is_symlink():
-            dim(f"  {dest_display} - symlink, skipping")
-            skipped += 1
-            continue
+        if stat.S_ISLNK(dest_mode):
+            return "skipped", f"  {dest_display} - symlink, skipping"
 
-        # Check if different
-        if source_abs.exists():
-            if dest_abs.is_dir():
-                # For directories, always collect (can't easily diff)
-                pass
-            else:
-                if source_abs.read_bytes() == dest_abs.read_bytes():
-                    dim(f"  {dest_display} - unchanged")
-                    skipped += 1
-                    continue
+        dest_is_dir = stat.S_ISDIR(dest_mode)
+
+        # Check if different (directories are always collected; they
+        # cannot easily be diffed)
+        if not dest_is_dir and source_abs.exists():
+            if _files_equal(source_abs, dest_abs):
+                return "skipped", f"  {dest_display} - unchanged"
 
         if dry_run:
-            info(f"[dry-run] would collect {dest_display}")
-            collected += 1
-            continue
+            return "collected", f"[dry-run] would collect {dest_display}"
 
         # Copy from home to repo
         try:
             source_abs.parent.mkdir(parents=True, exist_ok=True)
-            if dest_abs.is_dir():
+            if dest_is_dir:
                 if source_abs.exists():
                     shutil.rmtree(source_abs)
                 shutil.copytree(dest_abs, source_abs)
             else:
                 shutil.copy2(dest_abs, source_abs)
-            success(f"{dest_display}")
-            collected += 1
+            return "collected", dest_display
         except Exception as e:
-            error(f"{dest_display} - {e}")
+            return "error", f"{dest_display} - {e}"
+
+    collected = 0
+    skipped = 0
+
+    # Entries touch disjoint paths, so they run in parallel; map yields
+    # in submission order so output stays deterministic on the main thread
+    with ThreadPoolExecutor(max_workers=_io_workers(len(entries))) as pool:
+        for status, line in pool.map(_collect_entry, entries):
+            if status == "skipped":
+                dim(line)
+                skipped += 1
+            elif status == "error":
+                error(line)
+            elif dry_run:
+                info(line)
+                collected += 1
+            else:
+                success(line)
+                collected += 1
 
     print()
     if collected:
@@ -230,14 +286,11 @@ def push(message: str = "minor fix"):
         info("No changes to commit")
         return True
 
-    # Stage all changes
-    git.add_all(cfg.dotfiles_path)
-
     # Show what we're committing
     dim(git.diff_stat(cfg.dotfiles_path))
 
-    # Commit
-    if not git.commit(cfg.dotfiles_path, message):
+    # Stage and commit in one fork
+    if not git.commit_all(cfg.dotfiles_path, message):
         error("git commit failed")
         return False
 
@@ -274,20 +327,24 @@ def diff():
 
     table = create_table("Status", "Type", "Destination")
 
-    for entry in entries:
+    def _entry_status(entry) -> str:
         source_abs = cfg.dotfiles_path / entry.source
-        dest_display = f"~/{entry.dest}"
-
         if not source_abs.exists():
-            table.add_row("[red]missing src[/red]", entry.type, dest_display)
-            continue
-
+            return "missing src"
         if entry.type == "symlink":
-            status = check_symlink(source_abs, entry.dest)
-        else:
-            status = check_copy(source_abs, entry.dest)
+            return check_symlink(source_abs, entry.dest)
+        return check_copy(source_abs, entry.dest)
+
+    # Checks are pure stats/reads, so they run in parallel; rows are
+    # added from the main thread in entry order
+    statuses = manifest.map_entries(_entry_status, cfg.platform)
+
+    for entry, status in zip(entries, statuses):
+        dest_display = f"~/{entry.dest}"
 
-        if status == "ok":
+        if status == "missing src":
+            table.add_row("[red]missing src[/red]", entry.type, dest_display)
+        elif status == "ok":
             table.add_row("[green]\u2713 ok[/green]", entry.type, dest_display)
         elif status == "missing":
             table.add_row("[yellow]missing[/yellow]", entry.type, dest_display)
@@ -353,11 +410,21 @@ def add(
     # Create parent directories
     source_abs.parent.mkdir(parents=True, exist_ok=True)
 
-    # Move or copy file to repo
+    # Move or copy file to repo. Re-adding a mostly-unchanged directory
+    # (e.g. .config/nvim) goes through rsync, which only touches the
+    # files that differ instead of rewriting the whole tree.
     if file_path.is_dir():
-        if source_abs.exists():
-            shutil.rmtree(source_abs)
-        shutil.copytree(file_path, source_abs)
+        from ..utils.run import has_command
+
+        if has_command("rsync"):
+            subprocess.run(
+                ["rsync", "-a", "--delete", f"{file_path}/", f"{source_abs}/"],
+                check=True,
+            )
+        else:
+            if source_abs.exists():
+                shutil.rmtree(source_abs)
+            shutil.copytree(file_path, source_abs)
     else:
         shutil.copy2(file_path, source_abs)
 
@@ -371,6 +438,17 @@ def add(
         else:
             file_path.unlink()
         file_path.symlink_to(source_abs)
+    elif not file_path.is_dir():
+        # Copy type: relink the home file as a hardlink to the repo copy
+        # where the filesystem allows it - zero extra bytes and future
+        # edits on either side stay in sync until a tool rewrites the
+        # inode. Cross-device (or any link failure) keeps the plain copy.
+        try:
+            file_path.unlink()
+            os.link(source_abs, file_path)
+        except OSError:
+            if not file_path.exists():
+                shutil.copy2(source_abs, file_path)
 
     if secret:
         info(f"Added to secrets/ (will be encrypted by git-crypt)")
@@ -387,9 +465,10 @@ def status():
     header("Dotfiles Status")
 
     # Git info
-    branch = git.current_branch(cfg.dotfiles_path)
-    ahead = git.is_ahead_of_remote(cfg.dotfiles_path)
-    behind = git.is_behind_remote(cfg.dotfiles_path)
+    state = git.get_repo_state(cfg.dotfiles_path)
+    branch = state.branch if state else ""
+    ahead = state.ahead if state else None
+    behind = state.behind if state else None
 
     sync_status = ""
     if ahead and ahead > 0:
@@ -408,22 +487,16 @@ def status():
 
     console.print(f"  Files: {symlinks} symlinks, {copies} copies")
 
-    # Check for issues
-    issues = 0
-    for entry in entries:
+    # Check for issues (independent stat-bound checks, run threaded)
+    def _entry_ok(entry) -> bool:
         source_abs = cfg.dotfiles_path / entry.source
-
         if not source_abs.exists():
-            issues += 1
-            continue
-
+            return False
         if entry.type == "symlink":
-            status = check_symlink(source_abs, entry.dest)
-        else:
-            status = check_copy(source_abs, entry.dest)
+            return check_symlink(source_abs, entry.dest) == "ok"
+        return check_copy(source_abs, entry.dest) == "ok"
 
-        if status != "ok":
-            issues += 1
+    issues = sum(not ok for ok in manifest.map_entries(_entry_ok, cfg.platform))
 
     if issues:
         warning(f"  {issues} file(s) need attention - run 'dotfiles diff' for details")
@@ -468,6 +541,7 @@ DEFAULT_EXCLUDE = [
     "dot_gitconfig",
     "private_*",
     "secret*",
+    "secrets.fish",
     "*.age",
     ".env",
     "*.key",
@@ -476,27 +550,27 @@ DEFAULT_EXCLUDE = [
 
 
 def _load_publish_config() -> dict:
-    """Load publish configuration from publish.yaml."""
-    import yaml
+    """Load publish configuration from publish.yaml (cached on mtime).
+
+    Callers must treat the returned dict as read-only.
+    """
+    from ..files._yaml_cache import load_yaml
 
     cfg = get_config()
 
-    if not cfg.publish_yaml.exists():
+    try:
+        return load_yaml(cfg.publish_yaml) or {}
+    except FileNotFoundError:
         return {}
 
-    with open(cfg.publish_yaml) as f:
-        return yaml.safe_load(f) or {}
-
 
 def _save_publish_config(data: dict):
     """Save publish configuration to publish.yaml."""
-    import yaml
-
     cfg = get_config()
     cfg.publish_yaml.parent.mkdir(parents=True, exist_ok=True)
 
     with open(cfg.publish_yaml, "w") as f:
-        yaml.dump(data, f, default_flow_style=False)
+        yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False)
 
 
 def publish(
@@ -513,20 +587,16 @@ def publish(
         push: Push to public repo after sync (default: True)
         message: Commit message for push
     """
-    import subprocess
-
     cfg = get_config()
     publish_cfg = _load_publish_config()
 
     output_dir = Path(output) if output else cfg.dotfiles_path / "public"
 
-    # Build exclude list
-    excludes = DEFAULT_EXCLUDE.copy()
-    # Add excludes from config
-    if "exclude" in publish_cfg:
-        excludes.extend(publish_cfg["exclude"])
-    if exclude:
-        excludes.extend(exclude)
+    # Build exclude list; dict.fromkeys dedupes while keeping order so
+    # rsync doesn't re-match duplicate patterns against every path
+    excludes = list(dict.fromkeys(
+        [*DEFAULT_EXCLUDE, *publish_cfg.get("exclude", []), *(exclude or [])]
+    ))
 
     header("Publishing dotfiles")
     info(f"Output: {output_dir}")
@@ -534,14 +604,20 @@ def publish(
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Build rsync command
-    rsync_args = ["rsync", "-av", "--delete"]
-    for pattern in excludes:
-        rsync_args.extend(["--exclude", pattern])
-    rsync_args.extend([f"{cfg.dotfiles_path}/", str(output_dir)])
+    # Build rsync command (no -v: the listing was never shown anyway)
+    rsync_args = [
+        "rsync", "-a", "--delete",
+        *(arg for pat in excludes for arg in ("--exclude", pat)),
+        f"{cfg.dotfiles_path}/", str(output_dir),
+    ]
 
-    # Run rsync
-    result = subprocess.run(rsync_args, capture_output=True, text=True)
+    # Run rsync; discard stdout rather than buffering it in memory
+    result = subprocess.run(
+        rsync_args,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
 
     if result.returncode != 0:
         error("rsync failed")
@@ -549,22 +625,6 @@ def publish(
             print(result.stderr)
         return False
 
-    # Additional cleanup for any files that slipped through
-    cleanup_patterns = [
-        "**/secrets.fish",
-        "**/.env",
-        "**/private_*",
-    ]
-
-    for pattern in cleanup_patterns:
-        for match in output_dir.glob(pattern):
-            if match.is_file():
-                match.unlink()
-                dim(f"  Removed: {match.relative_to(output_dir)}")
-            elif match.is_dir():
-                shutil.rmtree(match)
-                dim(f"  Removed: {match.relative_to(output_dir)}/")
-
     success(f"Synced to: {output_dir}")
 
     # Push to public repo if configured
@@ -576,66 +636,35 @@ def publish(
             info(f"  Add 'public_repo: <url>' to {cfg.publish_yaml}")
             return True
 
-        # Initialize git if needed
-        git_dir = output_dir / ".git"
-        if not git_dir.exists():
-            info("Initializing git repo...")
-            subprocess.run(["git", "init"], cwd=output_dir, capture_output=True)
-            subprocess.run(
-                ["git", "remote", "add", "origin", public_repo],
-                cwd=output_dir,
-                capture_output=True,
-            )
+        # Init, remote setup, add, commit, and push run as one shell
+        # invocation instead of seven subprocess round trips. The remote
+        # is set idempotently (set-url falls back to add), the porcelain
+        # check exits early via a sentinel, and the main/master branch
+        # fallback becomes a shell ||.
+        import shlex
 
-        # Check remote is correct
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=output_dir,
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0 and result.stdout.strip() != public_repo:
-            info(f"Updating remote to: {public_repo}")
-            subprocess.run(
-                ["git", "remote", "set-url", "origin", public_repo],
-                cwd=output_dir,
-                capture_output=True,
-            )
-
-        # Commit and push
         info("Pushing to public repo...")
-        subprocess.run(["git", "add", "."], cwd=output_dir, capture_output=True)
-
-        # Check if there are changes
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=output_dir,
-            capture_output=True,
-            text=True,
-        )
-        if not result.stdout.strip():
-            info("No changes to push")
-            return True
-
-        subprocess.run(
-            ["git", "commit", "-m", message], cwd=output_dir, capture_output=True
+        repo_q = shlex.quote(public_repo)
+        script = (
+            "[ -d .git ] || git init -q; "
+            f"git remote set-url origin {repo_q} 2>/dev/null "
+            f"|| git remote add origin {repo_q}; "
+            "git add .; "
+            'if [ -z "$(git status --porcelain)" ]; then echo __no_changes__; exit 0; fi; '
+            f"git commit -q -m {shlex.quote(message)} && "
+            "(git push -u origin main --force 2>/dev/null "
+            "|| git push -u origin master --force)"
         )
-
         result = subprocess.run(
-            ["git", "push", "-u", "origin", "main", "--force"],
+            ["bash", "-c", script],
             cwd=output_dir,
             capture_output=True,
             text=True,
         )
 
-        if result.returncode != 0:
-            # Try master branch
-            result = subprocess.run(
-                ["git", "push", "-u", "origin", "master", "--force"],
-                cwd=output_dir,
-                capture_output=True,
-                text=True,
-            )
+        if "__no_changes__" in result.stdout:
+            info("No changes to push")
+            return True
 
         if result.returncode == 0:
             success(f"Pushed to: {public_repo}")
@@ -657,18 +686,8 @@ def generate_bootstrap(repo: Optional[str] = None) -> str:
     cfg = get_config()
 
     if not repo:
-        # Try to get repo URL from git remote
-        import subprocess
-
-        result = subprocess.run(
-            ["git", "-C", str(cfg.dotfiles_path), "remote", "get-url", "origin"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            repo = result.stdout.strip()
-        else:
-            repo = "git@github.com:USERNAME/dotfiles.git"
+        # Auto-detect from the origin remote (cached in utils.git)
+        repo = git.remote_url(cfg.dotfiles_path) or "git@github.com:USERNAME/dotfiles.git"
 
     # Read template from scripts/bootstrap.sh
     template_path = cfg.scripts_path / "bootstrap.sh"
@@ -676,10 +695,78 @@ def generate_bootstrap(repo: Optional[str] = None) -> str:
     return template.format(repo=repo)
 
 
+# monotonic timestamp of the last successful gh auth check; auth state
+# is sticky enough that rechecking within the TTL is pure overhead
+_GH_AUTH_AT: Optional[float] = None
+_GH_AUTH_TTL = 600.0
+
+
+def _gh_authenticated() -> bool:
+    """True when gh auth status succeeds (cached for _GH_AUTH_TTL)."""
+    import time
+
+    from ..utils.run import run_quiet
+
+    global _GH_AUTH_AT
+    if _GH_AUTH_AT is not None and time.monotonic() - _GH_AUTH_AT < _GH_AUTH_TTL:
+        return True
+
+    if run_quiet(["gh", "auth", "status"]).returncode != 0:
+        return False
+    _GH_AUTH_AT = time.monotonic()
+    return True
+
+
+def _gh_token() -> Optional[str]:
+    """GitHub token from the environment or gh's own hosts.yml."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    hosts = Path.home() / ".config" / "gh" / "hosts.yml"
+    try:
+        with open(hosts) as f:
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+    except OSError:
+        return None
+    return data.get("github.com", {}).get("oauth_token")
+
+
+def _gist_api(method: str, path: str, payload: Optional[dict] = None) -> Optional[dict]:
+    """Call the gist API in-process with urllib.
+
+    Returns the parsed response, or None when no token is available or
+    the request fails — callers fall back to the gh subprocess, which
+    costs a full CLI startup per call.
+    """
+    import json
+    import urllib.error
+    import urllib.request
+
+    token = _gh_token()
+    if not token:
+        return None
+
+    req = urllib.request.Request(
+        f"https://api.github.com{path}",
+        data=json.dumps(payload).encode() if payload is not None else None,
+        method=method,
+        headers={
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github+json",
+        },
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return json.loads(resp.read())
+    except (urllib.error.URLError, TimeoutError, ValueError):
+        return None
+
+
 def publish_gist(
     gist_id: Optional[str] = None,
     repo: Optional[str] = None,
     filename: str = "bootstrap.sh",
+    prune_old: bool = False,
 ):
     """Publish bootstrap script to GitHub gist.
 
@@ -687,6 +774,7 @@ def publish_gist(
         gist_id: Existing gist ID to update (creates new if not provided)
         repo: Git repository URL for the bootstrap script
         filename: Filename in the gist (default: bootstrap.sh)
+        prune_old: Also delete other files already in the gist
     """
     from ..utils.run import run_quiet, has_command
 
@@ -695,9 +783,8 @@ def publish_gist(
         info("Install with: brew install gh")
         return False
 
-    # Check gh auth
-    result = run_quiet(["gh", "auth", "status"])
-    if result.returncode != 0:
+    # Check gh auth (cached per process)
+    if not _gh_authenticated():
         error("Not authenticated with GitHub")
         info("Run: gh auth login")
         return False
@@ -709,7 +796,6 @@ def publish_gist(
 
     # Write to temp file with correct name
     import tempfile
-    import os
 
     temp_dir = tempfile.mkdtemp()
     temp_path = os.path.join(temp_dir, filename)
@@ -720,57 +806,69 @@ def publish_gist(
         if gist_id:
             # Update existing gist via API
             info(f"Updating gist: {gist_id}")
-            import subprocess
             import json
 
-            # Get existing files to delete old ones
-            view_result = subprocess.run(
-                ["gh", "api", f"/gists/{gist_id}", "-q", ".files | keys[]"],
-                capture_output=True,
-                text=True,
-            )
-            old_files = (
-                view_result.stdout.strip().split("\n")
-                if view_result.returncode == 0
-                else []
-            )
-
-            # Build payload: add new file, delete old files
+            # The API overwrites by filename, so the usual same-name
+            # update needs just the PATCH. Listing existing files (an
+            # extra round trip) only happens when pruning.
             files_payload = {filename: {"content": content}}
-            for old_file in old_files:
-                if old_file and old_file != filename:
-                    files_payload[old_file] = None  # null deletes the file
-
-            result = subprocess.run(
-                ["gh", "api", "-X", "PATCH", f"/gists/{gist_id}", "--input", "-"],
-                input=json.dumps({"files": files_payload}),
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0:
-                error("Failed to update gist")
-                if result.stderr:
-                    print(result.stderr)
-                return False
+            if prune_old:
+                listed = _gist_api("GET", f"/gists/{gist_id}")
+                if listed is not None:
+                    old_files = list(listed.get("files", {}))
+                else:
+                    view_result = subprocess.run(
+                        ["gh", "api", f"/gists/{gist_id}", "-q", ".files | keys[]"],
+                        capture_output=True,
+                        text=True,
+                    )
+                    old_files = (
+                        view_result.stdout.strip().split("\n")
+                        if view_result.returncode == 0
+                        else []
+                    )
+                for old_file in old_files:
+                    if old_file and old_file != filename:
+                        files_payload[old_file] = None  # null deletes the file
+
+            if _gist_api("PATCH", f"/gists/{gist_id}", {"files": files_payload}) is None:
+                result = subprocess.run(
+                    ["gh", "api", "-X", "PATCH", f"/gists/{gist_id}", "--input", "-"],
+                    input=json.dumps({"files": files_payload}),
+                    capture_output=True,
+                    text=True,
+                )
+                if result.returncode != 0:
+                    error("Failed to update gist")
+                    if result.stderr:
+                        print(result.stderr)
+                    return False
             gist_url = f"https://gist.github.com/{gist_id}"
         else:
             # Create new gist
             info("Creating new gist...")
-            import subprocess
-
-            result = subprocess.run(
-                ["gh", "gist", "create", "--public", temp_path],
-                capture_output=True,
-                text=True,
+            created = _gist_api(
+                "POST",
+                "/gists",
+                {"public": True, "files": {filename: {"content": content}}},
             )
-            if result.returncode != 0:
-                error("Failed to create gist")
-                if result.stderr:
-                    print(result.stderr)
-                return False
-            gist_url = result.stdout.strip()
-            # Extract gist ID from URL
-            gist_id = gist_url.split("/")[-1]
+            if created is not None:
+                gist_id = created["id"]
+                gist_url = created.get("html_url", f"https://gist.github.com/{gist_id}")
+            else:
+                result = subprocess.run(
+                    ["gh", "gist", "create", "--public", temp_path],
+                    capture_output=True,
+                    text=True,
+                )
+                if result.returncode != 0:
+                    error("Failed to create gist")
+                    if result.stderr:
+                        print(result.stderr)
+                    return False
+                gist_url = result.stdout.strip()
+                # Extract gist ID from URL
+                gist_id = gist_url.split("/")[-1]
 
         success(f"Gist published: {gist_url}")
 
@@ -797,11 +895,30 @@ def publish_gist(
         return True
 
     finally:
-        import shutil
-
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+def _tree_size(root) -> int:
+    """Total size of regular files under root via scandir.
+
+    DirEntry serves type and stat from the directory read, so this does
+    no extra stat per file the way rglob + Path.stat would.
+    """
+    total = 0
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+
 def import_dotfiles(dry_run: bool = False):
     """Scan home directory for common dotfiles and offer to add them.
 
@@ -834,10 +951,11 @@ def import_dotfiles(dry_run: bool = False):
     table = create_table("File", "Type", "Size")
     for dotfile in found:
         path = Path.home() / dotfile
-        ftype = "dir" if path.is_dir() else "file"
         if path.is_dir():
-            size = sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+            ftype = "dir"
+            size = _tree_size(path)
         else:
+            ftype = "file"
             size = path.stat().st_size
         size_str = f"{size / 1024:.1f}K" if size > 1024 else f"{size}B"
         table.add_row(f"~/{dotfile}", ftype, size_str)
@@ -860,8 +978,6 @@ def backup(name: Optional[str] = None):
     Args:
         name: Backup name (default: timestamp)
     """
-    import datetime
-
     cfg = get_config()
     manifest = Manifest.load(cfg.files_yaml)
 
@@ -886,24 +1002,40 @@ def backup(name: Optional[str] = None):
 
     header(f"Creating backup: {name}")
 
-    count = 0
-    for entry in manifest.for_platform(cfg.platform):
+    from concurrent.futures import ThreadPoolExecutor
+
+    entries = manifest.for_platform(cfg.platform)
+
+    def _backup_entry(entry):
+        """Copy one entry into the backup; returns its dest or None."""
         dest_abs = Path.home() / entry.dest
 
         if not dest_abs.exists():
-            continue
+            return None
 
         # Create parent dirs in backup
         backup_file = backup_path / entry.dest
         backup_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Copy file/dir
+        # Copy file/dir; str paths keep shutil on its sendfile /
+        # copy_file_range fast path
         if dest_abs.is_dir():
-            shutil.copytree(dest_abs, backup_file, symlinks=True)
+            shutil.copytree(
+                str(dest_abs),
+                str(backup_file),
+                symlinks=True,
+                copy_function=shutil.copy2,
+            )
         else:
-            shutil.copy2(dest_abs, backup_file)
-        count += 1
-        dim(f"  {entry.dest}")
+            shutil.copy2(str(dest_abs), str(backup_file))
+        return entry.dest
+
+    count = 0
+    with ThreadPoolExecutor(max_workers=_io_workers(len(entries))) as pool:
+        for dest in pool.map(_backup_entry, entries):
+            if dest is not None:
+                count += 1
+                dim(f"  {dest}")
 
     success(f"Backed up {count} files to: {backup_path}")
     return True
@@ -933,21 +1065,35 @@ def restore_backup(name: str):
 
     header(f"Restoring backup: {name}")
 
-    count = 0
-    for item in backup_path.rglob("*"):
-        if item.is_file():
-            rel_path = item.relative_to(backup_path)
-            dest = Path.home() / rel_path
-
-            # Remove existing (could be symlink)
-            if dest.exists() or dest.is_symlink():
-                if dest.is_dir() and not dest.is_symlink():
-                    shutil.rmtree(dest)
-                else:
-                    dest.unlink()
+    from concurrent.futures import ThreadPoolExecutor
+
+    # One walk collects every file; rglob would also yield directories
+    # and stat each entry to filter them
+    items = []
+    for dirpath, _, filenames in os.walk(backup_path):
+        rel_dir = os.path.relpath(dirpath, backup_path)
+        for fn in filenames:
+            items.append(fn if rel_dir == "." else os.path.join(rel_dir, fn))
+
+    def _restore_item(rel_path):
+        """Put one backed-up file back in place; returns its home-relative path."""
+        dest = Path.home() / rel_path
+
+        # Remove existing (could be symlink); one lstat classifies it
+        dest_exists, dest_mode = _probe(dest)
+        if dest_exists:
+            if stat.S_ISDIR(dest_mode):
+                shutil.rmtree(dest)
+            else:
+                dest.unlink()
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(os.path.join(backup_path, rel_path), str(dest))
+        return rel_path
 
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, dest)
+    count = 0
+    with ThreadPoolExecutor(max_workers=_io_workers(len(items))) as pool:
+        for rel_path in pool.map(_restore_item, items):
             count += 1
             dim(f"  {rel_path}")
 
@@ -955,6 +1101,23 @@ def restore_backup(name: str):
     return True
 
 
+def _count_files(root) -> int:
+    """Count regular files under root via scandir (no per-entry stat)."""
+    count = 0
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        count += 1
+        except OSError:
+            continue
+    return count
+
+
 def list_backups():
     """List available backups."""
     cfg = get_config()
@@ -974,7 +1137,7 @@ def list_backups():
 
     for b in backups:
         if b.is_dir():
-            file_count = sum(1 for _ in b.rglob("*") if _.is_file())
+            file_count = _count_files(b)
             # Parse date from name if possible
             try:
                 date = datetime.datetime.strptime(b.name, "%Y%m%d_%H%M%S")
@@ -986,6 +1149,26 @@ def list_backups():
     console.print(table)
 
 
+def _dirs_equal(a: Path, b: Path) -> bool:
+    """Compare two directory trees in-process with early exit.
+
+    Name sets are checked first, then file contents via _files_equal,
+    so diff -rq only ever runs on trees known to differ.
+    """
+    def listing(root: Path) -> dict:
+        files = {}
+        for dirpath, _, names in os.walk(root):
+            for name in names:
+                full = os.path.join(dirpath, name)
+                files[os.path.relpath(full, root)] = full
+        return files
+
+    files_a, files_b = listing(a), listing(b)
+    if files_a.keys() != files_b.keys():
+        return False
+    return all(_files_equal(Path(files_a[k]), Path(files_b[k])) for k in files_a)
+
+
 def diff_full(file: Optional[str] = None):
     """Show full file content diffs.
 
@@ -1011,19 +1194,33 @@ def diff_full(file: Optional[str] = None):
         if not source_abs.exists():
             continue
 
+        dest_exists, dest_mode = _probe(dest_abs)
+
         # For symlinks, check if pointing to right place
         if entry.type == "symlink":
-            if dest_abs.is_symlink():
+            if stat.S_ISLNK(dest_mode):
                 if dest_abs.resolve() == source_abs.resolve():
                     continue  # OK
-            elif not dest_abs.exists():
+            elif not dest_exists:
                 header(f"~/{entry.dest} (missing)")
                 info("File does not exist, will be created as symlink")
                 has_diff = True
                 continue
 
-        # For copies or conflicts, show diff
-        if dest_abs.exists() and dest_abs.is_file() and source_abs.is_file():
+        # A link that survived the check above gets classified by its
+        # target for the content comparison below
+        if stat.S_ISLNK(dest_mode):
+            try:
+                dest_mode = os.stat(dest_abs).st_mode
+            except OSError:
+                dest_mode = 0
+
+        # For copies or conflicts, show diff. The in-process equality
+        # checks gate the diff subprocess so in-sync entries (the
+        # steady-state majority) never pay a fork/exec.
+        if stat.S_ISREG(dest_mode) and source_abs.is_file():
+            if _files_equal(dest_abs, source_abs):
+                continue
             result = subprocess.run(
                 ["diff", "-u", str(dest_abs), str(source_abs)],
                 capture_output=True,
@@ -1033,7 +1230,9 @@ def diff_full(file: Optional[str] = None):
                 header(f"~/{entry.dest}")
                 print(result.stdout)
                 has_diff = True
-        elif dest_abs.is_dir() and source_abs.is_dir():
+        elif stat.S_ISDIR(dest_mode) and source_abs.is_dir():
+            if _dirs_equal(dest_abs, source_abs):
+                continue
             result = subprocess.run(
                 ["diff", "-rq", str(dest_abs), str(source_abs)],
                 capture_output=True,
@@ -1,5 +1,6 @@
 """Template support for dotfiles with variable substitution."""
 
+import functools
 import os
 import re
 import socket
@@ -7,11 +8,20 @@ from pathlib import Path
 from typing import Optional
 
 from ..config import get_config
+from ..files._fsutil import ensure_parent
 from ..utils.console import success, error, warning, info, header, dim
 
+# Compiled once; re.sub with a string pattern pays a cache lookup per call
+_TEMPLATE_RE = re.compile(r"\{\{(.+?)\}\}")
 
+
+@functools.lru_cache(maxsize=1)
 def get_template_vars() -> dict:
-    """Get default template variables."""
+    """Get default template variables.
+
+    Cached for the process: hostname, environment, and config don't
+    change mid-run. Callers must treat the returned dict as read-only.
+    """
     cfg = get_config()
 
     return {
@@ -25,62 +35,109 @@ def get_template_vars() -> dict:
     }
 
 
+# Resolved vars.yaml keyed by (mtime_ns, profile); bulk renders parse
+# the file once instead of once per template
+_CUSTOM_VARS_CACHE: dict[tuple[int, str], dict] = {}
+
+
 def load_custom_vars() -> dict:
-    """Load custom variables from .dotfiles/vars.yaml."""
-    import yaml
+    """Load custom variables from .dotfiles/vars.yaml (cached on mtime).
+
+    Callers must treat the returned dict as read-only.
+    """
+    from ..files._yaml_cache import load_yaml
 
     cfg = get_config()
     vars_file = cfg.dotfiles_internal / "vars.yaml"
 
-    if not vars_file.exists():
+    try:
+        mtime_ns = os.stat(vars_file).st_mtime_ns
+    except FileNotFoundError:
         return {}
 
-    with open(vars_file) as f:
-        data = yaml.safe_load(f) or {}
+    profile = os.environ.get("DOTFILES_PROFILE", "default")
+    key = (mtime_ns, profile)
+    cached = _CUSTOM_VARS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    data = load_yaml(vars_file) or {}
 
     # Support profile-specific vars
-    profile = os.environ.get("DOTFILES_PROFILE", "default")
     if "profiles" in data and profile in data["profiles"]:
         vars_dict = data.get("vars", {}).copy()
         vars_dict.update(data["profiles"][profile])
-        return vars_dict
+    else:
+        vars_dict = data.get("vars", {})
 
-    return data.get("vars", {})
+    _CUSTOM_VARS_CACHE[key] = vars_dict
+    return vars_dict
 
 
-def render_template(content: str, vars_dict: Optional[dict] = None) -> str:
-    """Render template with variable substitution.
+@functools.lru_cache(maxsize=256)
+def compile_template(content: str):
+    """Compile a template into a render function.
 
-    Supports:
-    - {{variable}} - simple substitution
-    - {{variable|default}} - with default value
-    - {{ENV:VAR}} - environment variable
+    The source is split once into literal/placeholder tokens and each
+    placeholder is turned into a small resolver closure, so rendering
+    is a str.join over precomputed pieces instead of a regex callback
+    per match. Compiled templates are cached on the source text.
     """
-    if vars_dict is None:
-        vars_dict = {}
+    parts = _TEMPLATE_RE.split(content)
+    literals = parts[0::2]
 
-    # Merge default vars with custom vars
-    all_vars = get_template_vars()
-    all_vars.update(load_custom_vars())
-    all_vars.update(vars_dict)
+    # No placeholders: rendering is the identity, skip the join entirely
+    if len(parts) == 1:
+        return lambda all_vars: content
 
-    def replace_var(match):
-        expr = match.group(1).strip()
+    def make_resolver(raw: str):
+        expr = raw.strip()
 
         # Environment variable
         if expr.startswith("ENV:"):
             env_var = expr[4:]
-            return os.environ.get(env_var, "")
+            return lambda all_vars: os.environ.get(env_var, "")
 
         # Variable with default
         if "|" in expr:
             var_name, default = expr.split("|", 1)
-            return all_vars.get(var_name.strip(), default.strip())
+            var_name, default = var_name.strip(), default.strip()
+            return lambda all_vars: all_vars.get(var_name, default)
 
-        # Simple variable
-        return all_vars.get(expr, match.group(0))
+        # Simple variable; unknown names render back verbatim
+        verbatim = "{{" + raw + "}}"
+        return lambda all_vars: all_vars.get(expr, verbatim)
 
-    return re.sub(r"\{\{(.+?)\}\}", replace_var, content)
+    resolvers = [make_resolver(raw) for raw in parts[1::2]]
+
+    def render(all_vars: dict) -> str:
+        out = []
+        for literal, resolve in zip(literals, resolvers):
+            out.append(literal)
+            out.append(resolve(all_vars))
+        out.append(literals[-1])
+        return "".join(out)
+
+    return render
+
+
+def merged_vars(extra: Optional[dict] = None) -> dict:
+    """Built-in + custom vars merged with extra, as a fresh dict.
+
+    Both loaders return cached dicts, so this is pure dict merging.
+    """
+    return {**get_template_vars(), **load_custom_vars(), **(extra or {})}
+
+
+def render_template(content: str, vars_dict: Optional[dict] = None) -> str:
+    """Render template with variable substitution.
+
+    Supports:
+    - {{variable}} - simple substitution
+    - {{variable|default}} - with default value
+    - {{ENV:VAR}} - environment variable
+    """
+    return compile_template(content)(merged_vars(vars_dict))
 
 
 def render_file(source: Path, dest: Path, vars_dict: Optional[dict] = None) -> bool:
@@ -98,7 +155,7 @@ def render_file(source: Path, dest: Path, vars_dict: Optional[dict] = None) -> b
     content = source.read_text()
     rendered = render_template(content, vars_dict)
 
-    dest.parent.mkdir(parents=True, exist_ok=True)
+    ensure_parent(dest)
     dest.write_text(rendered)
 
     return True
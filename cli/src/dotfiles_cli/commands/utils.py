@@ -1,6 +1,5 @@
 """Utility commands: get_ip, serve, init_ghostty."""
 
-import shutil
 from typing import Optional
 
 from ..utils.console import success, error, info, header
@@ -60,28 +59,19 @@ def init_ghostty(host: str):
     header(f"Setting up ghostty terminfo on {host}")
 
     # infocmp -x xterm-ghostty | ssh host -- tic -x -
-    import subprocess
+    from ..utils.run import pipeline
 
     try:
-        infocmp = subprocess.Popen(
+        result = pipeline([
             ["infocmp", "-x", "xterm-ghostty"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        ssh = subprocess.Popen(
             ["ssh", host, "--", "tic", "-x", "-"],
-            stdin=infocmp.stdout,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        infocmp.stdout.close()
-        _, stderr = ssh.communicate()
+        ])
 
-        if ssh.returncode == 0:
+        if result.returncode == 0:
             success(f"Ghostty terminfo installed on {host}")
             return True
         else:
-            error(f"Failed: {stderr.decode()}")
+            error(f"Failed: {result.stderr.decode()}")
             return False
     except Exception as e:
         error(f"Failed: {e}")
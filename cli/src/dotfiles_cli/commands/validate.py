@@ -4,8 +4,9 @@ from pathlib import Path
 
 import yaml
 
+from ..files._yaml_cache import load_yaml
 from ..config import get_config
-from ..utils.console import success, error, warning, info, header, dim
+from ..utils.console import success, error, warning, info, header, dim, batch
 
 
 def validate_all():
@@ -16,21 +17,24 @@ def validate_all():
 
     all_ok = True
 
-    # Validate files.yaml
-    if not _validate_files_yaml(cfg):
-        all_ok = False
+    # Each validator prints a result line (sometimes several); buffer
+    # them into one console flush
+    with batch():
+        # Validate files.yaml
+        if not _validate_files_yaml(cfg):
+            all_ok = False
 
-    # Validate publish.yaml
-    if not _validate_publish_yaml(cfg):
-        all_ok = False
+        # Validate publish.yaml
+        if not _validate_publish_yaml(cfg):
+            all_ok = False
 
-    # Validate packages.yaml
-    if not _validate_packages_yaml(cfg):
-        all_ok = False
+        # Validate packages.yaml
+        if not _validate_packages_yaml(cfg):
+            all_ok = False
 
-    # Validate vars.yaml (for templates)
-    if not _validate_vars_yaml(cfg):
-        all_ok = False
+        # Validate vars.yaml (for templates)
+        if not _validate_vars_yaml(cfg):
+            all_ok = False
 
     print()
     if all_ok:
@@ -48,8 +52,7 @@ def _validate_files_yaml(cfg) -> bool:
         return True
 
     try:
-        with open(cfg.files_yaml) as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(cfg.files_yaml)
 
         if not data:
             warning("  files.yaml: empty")
@@ -93,8 +96,7 @@ def _validate_publish_yaml(cfg) -> bool:
         return True
 
     try:
-        with open(cfg.publish_yaml) as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(cfg.publish_yaml)
 
         if not data:
             dim("  publish.yaml: empty")
@@ -126,8 +128,7 @@ def _validate_packages_yaml(cfg) -> bool:
         return True
 
     try:
-        with open(cfg.packages_yaml) as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(cfg.packages_yaml)
 
         if not data:
             dim("  packages.yaml: empty")
@@ -150,8 +151,7 @@ def _validate_vars_yaml(cfg) -> bool:
         return True
 
     try:
-        with open(vars_file) as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(vars_file)
 
         if not data:
             dim("  vars.yaml: empty")
@@ -1,12 +1,13 @@
 """Configuration and path management for dotfiles-cli."""
 
+import functools
 import os
 import platform
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """Configuration for dotfiles-cli."""
 
@@ -18,6 +19,7 @@ class Config:
     scripts_path: Path
     git_crypt_key: Path
     publish_yaml: Path
+    dotfiles_internal: Path  # .dotfiles/ (hooks, vars, backups, CLI source)
 
     @classmethod
     def load(cls) -> "Config":
@@ -35,19 +37,13 @@ class Config:
             scripts_path=dotfiles / "scripts",
             git_crypt_key=Path.home() / ".dotfiles-key",
             publish_yaml=config / "publish.yaml",
+            dotfiles_internal=dotfiles / ".dotfiles",
         )
 
-    @property
+    @functools.cached_property
     def platform(self) -> str:
-        """Get current platform: 'darwin', 'linux', or 'windows'."""
-        system = platform.system().lower()
-        if system == "darwin":
-            return "darwin"
-        elif system == "linux":
-            return "linux"
-        elif system == "windows":
-            return "windows"
-        return system
+        """Current platform: 'darwin', 'linux', or 'windows' (cached)."""
+        return platform.system().lower()
 
     @property
     def is_macos(self) -> bool:
@@ -64,13 +60,25 @@ class Config:
         self.platform_path.mkdir(parents=True, exist_ok=True)
 
 
-# Global config instance
-_config: Config | None = None
+@functools.lru_cache(maxsize=1)
+def cache_dir() -> Path:
+    """Per-user cache directory for generated artifacts.
+
+    Lives under ~/.cache (or XDG_CACHE_HOME), never inside the dotfiles
+    repo: anything written into the tracked tree shows up in git
+    status, gets swept into commits by push's git add -A, and rides
+    along on deploy rsyncs.
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "dotfiles-cli"
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
-    """Get or create the global config instance."""
-    global _config
-    if _config is None:
-        _config = Config.load()
-    return _config
+    """Get the global config instance, loading it once per process.
+
+    Long-running callers that change DOTFILES can invalidate with
+    get_config.cache_clear().
+    """
+    return Config.load()
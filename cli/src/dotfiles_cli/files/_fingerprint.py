@@ -0,0 +1,103 @@
+"""Content fingerprints cached on mtime for fast copy checks.
+
+filecmp.cmp(shallow=False) re-reads both files on every call, so a
+status run over many copies is bound by file I/O even when nothing
+changed. Here each file's digest is cached keyed on (mtime_ns, size)
+and persisted to hashes.json in the user cache dir, so repeat runs
+only hash files that were actually rewritten.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+try:
+    # ~10x faster than blake2 when available; the digests never leave
+    # the cache file, so collision resistance is not security-relevant
+    import xxhash
+
+    def _new_hash():
+        return xxhash.xxh3_64()
+except ImportError:
+    def _new_hash():
+        return hashlib.blake2b(digest_size=16)
+
+
+# path -> [mtime_ns, size, hexdigest]; loaded lazily, written back on
+# exit only when something was rehashed
+_CACHE: Optional[dict] = None
+_DIRTY = False
+
+
+def _cache_path() -> Path:
+    # Outside the dotfiles repo: a cache write inside the tracked tree
+    # would dirty git status on every copy-entry check
+    from ..config import cache_dir
+
+    return cache_dir() / "hashes.json"
+
+
+def _load() -> dict:
+    global _CACHE
+    if _CACHE is None:
+        try:
+            with open(_cache_path()) as f:
+                _CACHE = json.load(f)
+        except (OSError, ValueError):
+            _CACHE = {}
+        atexit.register(_save)
+    return _CACHE
+
+
+def _save():
+    if not _DIRTY or not _CACHE:
+        return
+    path = _cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(_CACHE))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _digest(path: str, st: os.stat_result) -> Optional[str]:
+    """Hex digest of a file, reusing the cache while its mtime holds."""
+    global _DIRTY
+
+    cache = _load()
+    entry = cache.get(path)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+
+    h = _new_hash()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    except OSError:
+        return None
+
+    digest = h.hexdigest()
+    cache[path] = [st.st_mtime_ns, st.st_size, digest]
+    _DIRTY = True
+    return digest
+
+
+def files_identical(a: Path, b: Path) -> bool:
+    """Compare two files by size, then cached content digest."""
+    try:
+        sa = os.stat(a)
+        sb = os.stat(b)
+    except OSError:
+        return False
+
+    if sa.st_size != sb.st_size:
+        return False
+
+    da = _digest(str(a), sa)
+    return da is not None and da == _digest(str(b), sb)
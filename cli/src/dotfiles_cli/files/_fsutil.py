@@ -0,0 +1,26 @@
+"""Small filesystem helpers shared by the file operations.
+
+Applying a manifest calls parent.mkdir(parents=True) once per entry,
+so directories with many tracked files (e.g. .config/nvim) get hit
+with the same redundant mkdir chain over and over. ensure_parent
+remembers which directories it has already created in this process
+and skips them.
+"""
+
+from pathlib import Path
+
+_ensured: set[Path] = set()
+
+
+def ensure_parent(path: Path):
+    """Create path's parent directory, skipping ones already ensured."""
+    parent = path.parent
+    if parent in _ensured:
+        return
+    parent.mkdir(parents=True, exist_ok=True)
+    # An existing directory covers all its ancestors too
+    while parent not in _ensured:
+        _ensured.add(parent)
+        if parent == parent.parent:
+            break
+        parent = parent.parent
@@ -0,0 +1,36 @@
+"""Process-level cache of parsed YAML files keyed on path + mtime.
+
+Several commands parse the same config file in one invocation (e.g.
+Manifest.load and the validator both read files.yaml). Routing those
+reads through load_yaml makes the second and later parses free while
+the file's mtime is unchanged; rewrites bump the mtime, so stale
+entries simply stop matching.
+"""
+
+import os
+
+import yaml
+
+try:
+    # libyaml-backed parser when PyYAML was built against it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+_cache: dict[tuple[str, int], object] = {}
+
+
+def load_yaml(path):
+    """Parse a YAML file, reusing the parse while its mtime is stable.
+
+    Propagates OSError from stat/open and yaml.YAMLError from parsing,
+    like an inline open + yaml.load would. Callers must treat the
+    returned object as read-only.
+    """
+    st = os.stat(path)
+    key = (str(path), st.st_mtime_ns)
+    if key not in _cache:
+        with open(path) as f:
+            _cache[key] = yaml.load(f, Loader=_YamlLoader)
+    return _cache[key]
@@ -2,9 +2,47 @@
 
 from pathlib import Path
 from typing import Optional
+import re
 import shutil
-import filecmp
 import os
+import stat
+import sys
+
+from ._fingerprint import files_identical
+from ._fsutil import ensure_parent
+
+# Resolved once: every per-entry helper joins against $HOME, and
+# Path.home() re-expands it on each call
+_HOME = Path.home()
+
+
+# FICLONE ioctl number (Linux): shares extents instead of copying
+# bytes on CoW filesystems like btrfs and XFS
+_FICLONE = 0x40049409
+
+
+def _clone_or_copy(src: str, dst: str) -> str:
+    """copytree copy_function that reflinks where the filesystem can.
+
+    On CoW filesystems the clone is metadata-only, so directory
+    backups cost O(entries) instead of O(bytes). Any failure (other
+    filesystems, non-Linux) falls back to a plain copy2; macOS already
+    gets APFS cloning through copy2's fcopyfile.
+    """
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+    return shutil.copy2(src, dst)
 
 
 def _backup_existing(dest_abs: Path, backup_dir: Optional[Path]) -> bool:
@@ -20,20 +58,23 @@ def _backup_existing(dest_abs: Path, backup_dir: Optional[Path]) -> bool:
 
     # Create backup path preserving structure relative to home
     try:
-        rel_path = dest_abs.relative_to(Path.home())
+        rel_path = dest_abs.relative_to(_HOME)
     except ValueError:
         rel_path = dest_abs.name
 
     backup_path = backup_dir / rel_path
-    backup_path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_parent(backup_path)
 
-    # Copy the file/dir to backup
+    # Copy the file/dir to backup; reflink where possible, and str
+    # paths keep the fallback on shutil's sendfile fast path
     if dest_abs.is_dir():
         if backup_path.exists():
             shutil.rmtree(backup_path)
-        shutil.copytree(dest_abs, backup_path)
+        shutil.copytree(
+            str(dest_abs), str(backup_path), copy_function=_clone_or_copy
+        )
     else:
-        shutil.copy2(dest_abs, backup_path)
+        _clone_or_copy(str(dest_abs), str(backup_path))
 
     return True
 
@@ -50,13 +91,14 @@ def copy_file(source: Path, dest: Path, force: bool = False, backup_dir: Optiona
     Returns:
         Tuple of (success, status_message)
     """
-    dest_abs = Path.home() / dest
-    dest_abs.parent.mkdir(parents=True, exist_ok=True)
+    dest_abs = _HOME / dest
+    ensure_parent(dest_abs)
 
     if dest_abs.exists():
-        # Check if already identical
+        # Check if already identical (mtime-cached digests, so repeat
+        # applies skip rereading unchanged files)
         if dest_abs.is_file() and source.is_file():
-            if filecmp.cmp(source, dest_abs, shallow=False):
+            if files_identical(source, dest_abs):
                 return True, "ok"  # Already identical
 
         if not force:
@@ -65,13 +107,14 @@ def copy_file(source: Path, dest: Path, force: bool = False, backup_dir: Optiona
         # Backup before overwriting
         _backup_existing(dest_abs, backup_dir)
 
-    # Copy the file (or directory)
+    # Copy the file (or directory); str paths keep shutil on its
+    # sendfile / copy_file_range fast path
     if source.is_dir():
         if dest_abs.exists():
             shutil.rmtree(dest_abs)
-        shutil.copytree(source, dest_abs)
+        shutil.copytree(str(source), str(dest_abs), copy_function=_clone_or_copy)
     else:
-        shutil.copy2(source, dest_abs)
+        shutil.copy2(str(source), str(dest_abs))
 
     # Set restrictive permissions for sensitive files
     if _is_sensitive(dest):
@@ -90,28 +133,62 @@ def check_copy(source: Path, dest: Path) -> str:
     Returns:
         Status string: "ok", "missing", "changed"
     """
-    dest_abs = Path.home() / dest
+    dest_abs = _HOME / dest
 
-    if not dest_abs.exists():
+    # One stat per side replaces the exists/is_file/is_dir triple
+    try:
+        dest_mode = os.stat(dest_abs).st_mode
+    except OSError:
         return "missing"
 
-    if source.is_file() and dest_abs.is_file():
-        if filecmp.cmp(source, dest_abs, shallow=False):
+    try:
+        source_mode = os.stat(source).st_mode
+    except OSError:
+        return "changed"
+
+    if stat.S_ISREG(source_mode) and stat.S_ISREG(dest_mode):
+        if files_identical(source, dest_abs):
             return "ok"
         return "changed"
 
-    if source.is_dir() and dest_abs.is_dir():
+    if stat.S_ISDIR(source_mode) and stat.S_ISDIR(dest_mode):
         # For directories, do a shallow check
-        cmp = filecmp.dircmp(source, dest_abs)
-        if not cmp.diff_files and not cmp.left_only and not cmp.right_only:
+        if _dirs_match(source, dest_abs):
             return "ok"
         return "changed"
 
     return "changed"
 
 
+def _dirs_match(a: Path, b: Path) -> bool:
+    """Shallow directory comparison via one scandir pass per side.
+
+    Mirrors filecmp.dircmp's top-level check (same names; same size
+    and mtime for regular files - copy2 preserves both) without its
+    per-entry stat storms.
+    """
+    def snapshot(root: Path):
+        out = {}
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        out[entry.name] = (st.st_size, st.st_mtime_ns)
+                    else:
+                        out[entry.name] = None
+        except OSError:
+            return None
+        return out
+
+    snap_a = snapshot(a)
+    return snap_a is not None and snap_a == snapshot(b)
+
+
+# One compiled alternation instead of a Python-level substring loop
+_SENSITIVE_RE = re.compile(r"ssh|secret|key|credential|token|password", re.IGNORECASE)
+
+
 def _is_sensitive(path: Path) -> bool:
     """Check if a path is likely sensitive (SSH keys, secrets, etc.)."""
-    path_str = str(path).lower()
-    sensitive_patterns = ["ssh", "secret", "key", "credential", "token", "password"]
-    return any(p in path_str for p in sensitive_patterns)
+    return _SENSITIVE_RE.search(str(path)) is not None
@@ -2,8 +2,30 @@
 
 from pathlib import Path
 from typing import Optional
+import errno
+import os
 import shutil
 
+from ._fsutil import ensure_parent
+
+# Resolved once: every per-entry helper joins against $HOME, and
+# Path.home() re-expands it on each call
+_HOME = Path.home()
+
+
+def _links_to(dest_abs: Path, source: Path) -> bool:
+    """Fast steady-state check: one readlink against the raw target.
+
+    apply() writes links with symlink_to(source), so an unchanged link
+    matches the source path verbatim and we skip the multi-syscall
+    resolve() comparison. Non-links and mismatches return False and
+    fall through to the slower, exact checks.
+    """
+    try:
+        return os.readlink(dest_abs) == str(source)
+    except OSError:
+        return False
+
 
 def _backup_existing(dest_abs: Path, backup_dir: Optional[Path]) -> bool:
     """Backup existing file/dir before overwriting.
@@ -18,12 +40,12 @@ def _backup_existing(dest_abs: Path, backup_dir: Optional[Path]) -> bool:
 
     # Create backup path preserving structure relative to home
     try:
-        rel_path = dest_abs.relative_to(Path.home())
+        rel_path = dest_abs.relative_to(_HOME)
     except ValueError:
         rel_path = dest_abs.name
 
     backup_path = backup_dir / rel_path
-    backup_path.parent.mkdir(parents=True, exist_ok=True)
+    ensure_parent(backup_path)
 
     # Copy the file/dir to backup
     if dest_abs.is_symlink():
@@ -52,13 +74,19 @@ def create_symlink(source: Path, dest: Path, force: bool = False, backup_dir: Op
     Returns:
         Tuple of (success, status_message)
     """
-    dest_abs = Path.home() / dest
-    dest_abs.parent.mkdir(parents=True, exist_ok=True)
+    dest_abs = _HOME / dest
+
+    if _links_to(dest_abs, source):
+        return True, "ok"  # Already correct
+
+    ensure_parent(dest_abs)
 
     if dest_abs.exists() or dest_abs.is_symlink():
         if dest_abs.is_symlink():
             try:
-                if dest_abs.resolve() == source.resolve():
+                # One stat per side ((st_dev, st_ino) identity) instead
+                # of resolve()'s per-component walk of both paths
+                if os.path.samefile(dest_abs, source):
                     return True, "ok"  # Already correct
             except OSError:
                 pass  # Broken symlink
@@ -88,7 +116,7 @@ def remove_symlink(dest: Path) -> bool:
     Returns:
         True if removed, False if not a symlink
     """
-    dest_abs = Path.home() / dest
+    dest_abs = _HOME / dest
 
     if dest_abs.is_symlink():
         dest_abs.unlink()
@@ -106,17 +134,26 @@ def check_symlink(source: Path, dest: Path) -> str:
     Returns:
         Status string: "ok", "missing", "wrong", "conflict", "broken"
     """
-    dest_abs = Path.home() / dest
+    dest_abs = _HOME / dest
 
-    if not dest_abs.exists() and not dest_abs.is_symlink():
+    # One readlink classifies everything: a target means symlink (and
+    # the verbatim match is the steady-state "ok"), EINVAL means some
+    # non-link file is in the way, any other error means nothing there
+    try:
+        target = os.readlink(dest_abs)
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            return "conflict"  # Regular file/dir exists
         return "missing"
 
-    if not dest_abs.is_symlink():
-        return "conflict"  # Regular file/dir exists
+    if target == str(source):
+        return "ok"
 
-    # It's a symlink, check if it points to the right place
+    # Link with a different raw target: compare inode identity to rule
+    # out an equivalent path before calling it wrong. One stat per side
+    # instead of resolve()'s per-component walk.
     try:
-        if dest_abs.resolve() == source.resolve():
+        if os.path.samefile(dest_abs, source):
             return "ok"
         else:
             return "wrong"  # Points elsewhere
@@ -1,11 +1,27 @@
 """Manifest file (files.yaml) parsing and management."""
 
+import hashlib
+import os
+import pickle
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
 
 import yaml
 
+from ._yaml_cache import load_yaml
+
+try:
+    # libyaml-backed emitter when PyYAML was built against it
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+
+# Parsed-manifest cache keyed by (path, mtime_ns). Saving rewrites the
+# file and bumps its mtime, so stale entries age out on their own.
+_CACHE: dict[tuple[str, int], "Manifest"] = {}
+
 
 @dataclass
 class FileEntry:
@@ -24,26 +40,67 @@ class Manifest:
     entries: list[FileEntry]
     path: Path  # Path to manifest file
 
+    def __post_init__(self):
+        # Per-platform filter results; cleared whenever entries mutate
+        self._platform_cache: dict[str, list[FileEntry]] = {}
+        # Destination -> entry index for O(1) lookup and removal
+        self._by_dest: dict[Path, FileEntry] = {e.dest: e for e in self.entries}
+
+    @staticmethod
+    def _pickle_path(path: Path) -> Path:
+        """Pre-parsed sidecar for a manifest, under the user cache dir.
+
+        Deliberately outside the dotfiles repo so read-only commands
+        never dirty the tracked tree.
+        """
+        from ..config import cache_dir
+
+        tag = hashlib.blake2b(str(path).encode(), digest_size=8).hexdigest()
+        return cache_dir() / f"manifest-{tag}.pkl"
+
     @classmethod
     def load(cls, path: Path) -> "Manifest":
-        """Load manifest from YAML file."""
-        if not path.exists():
+        """Load manifest from YAML file (cached on the file's mtime)."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             return cls(entries=[], path=path)
 
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        key = (str(path), st.st_mtime_ns)
+        cached = _CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        # Cross-invocation fast path: unpickle the pre-parsed entries
+        # while the sidecar is at least as new as the YAML. Saving
+        # rewrites the YAML, so a stale sidecar loses the mtime race
+        # and gets rebuilt below.
+        pkl = cls._pickle_path(path)
+        try:
+            if pkl.stat().st_mtime_ns >= st.st_mtime_ns:
+                with open(pkl, "rb") as f:
+                    entries = pickle.load(f)
+                manifest = cls(entries, path)
+                _CACHE[key] = manifest
+                return manifest
+        except (OSError, pickle.PickleError, EOFError):
+            pass
+
+        data = load_yaml(path) or {}
 
         entries = []
 
         # New format: list of entries
         if "entries" in data:
-            for item in data["entries"]:
-                entries.append(FileEntry(
+            entries = [
+                FileEntry(
                     source=Path(item["source"]),
                     dest=Path(item["dest"]),
                     type=item.get("type", "symlink"),
                     platform=item.get("platform"),
-                ))
+                )
+                for item in data["entries"]
+            ]
         else:
             # Legacy format: symlinks/copies dicts
             for src, dest in data.get("symlinks", {}).items():
@@ -58,47 +115,59 @@ class Manifest:
                 for src, dest in sections.get("copies", {}).items():
                     entries.append(FileEntry(Path(src), Path(dest), "copy", platform))
 
-        return cls(entries, path)
+        # Best-effort sidecar refresh; losing it only costs a reparse
+        try:
+            pkl.parent.mkdir(parents=True, exist_ok=True)
+            tmp = pkl.with_name(pkl.name + ".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, pkl)
+        except OSError:
+            pass
+
+        manifest = cls(entries, path)
+        _CACHE[key] = manifest
+        return manifest
 
     def save(self):
-        """Save manifest back to YAML file."""
-        data: dict = {"symlinks": {}}
-
-        for entry in self.entries:
-            section = "symlinks" if entry.type == "symlink" else "copies"
-
-            if entry.platform:
-                # Platform-specific entry
-                if "platform" not in data:
-                    data["platform"] = {}
-                if entry.platform not in data["platform"]:
-                    data["platform"][entry.platform] = {}
-                if section not in data["platform"][entry.platform]:
-                    data["platform"][entry.platform][section] = {}
-                data["platform"][entry.platform][section][str(entry.source)] = str(entry.dest)
+        """Save manifest back to YAML file.
+
+        Entries are grouped by (platform, section) up front, so only
+        non-empty groups ever exist - no per-entry branching and no
+        empty-section cleanup pass. Sorting is stable, which keeps the
+        output deterministic (global symlinks, then copies, then the
+        platform blocks) regardless of insertion order.
+        """
+        import itertools
+
+        def group_key(entry):
+            return (entry.platform or "", 0 if entry.type == "symlink" else 1)
+
+        data: dict = {}
+        platform_data: dict = {}
+        for (plat, kind), group in itertools.groupby(
+            sorted(self.entries, key=group_key), key=group_key
+        ):
+            section = "symlinks" if kind == 0 else "copies"
+            mapping = {str(e.source): str(e.dest) for e in group}
+            if plat:
+                platform_data.setdefault(plat, {})[section] = mapping
             else:
-                # Global entry
-                if section not in data:
-                    data[section] = {}
-                data[section][str(entry.source)] = str(entry.dest)
-
-        # Clean empty sections
-        for key in list(data.keys()):
-            if not data[key]:
-                del data[key]
-        if "platform" in data:
-            for plat in list(data["platform"].keys()):
-                for section in list(data["platform"][plat].keys()):
-                    if not data["platform"][plat][section]:
-                        del data["platform"][plat][section]
-                if not data["platform"][plat]:
-                    del data["platform"][plat]
-            if not data["platform"]:
-                del data["platform"]
+                data[section] = mapping
+
+        if platform_data:
+            data["platform"] = platform_data
 
         self.path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                data,
+                f,
+                Dumper=_YamlDumper,
+                default_flow_style=False,
+                sort_keys=False,
+                width=10**9,
+            )
 
     def add(
         self,
@@ -108,38 +177,62 @@ class Manifest:
         platform: Optional[str] = None,
     ):
         """Add a new entry to the manifest."""
+        self._platform_cache.clear()
+
         # Check if already exists
-        for entry in self.entries:
-            if entry.dest == dest:
-                # Update existing
-                entry.source = source
-                entry.type = type
-                entry.platform = platform
-                self.save()
-                return
-
-        self.entries.append(FileEntry(source, dest, type, platform))
+        entry = self._by_dest.get(dest)
+        if entry is not None:
+            # Update existing
+            entry.source = source
+            entry.type = type
+            entry.platform = platform
+            self.save()
+            return
+
+        entry = FileEntry(source, dest, type, platform)
+        self.entries.append(entry)
+        self._by_dest[dest] = entry
         self.save()
 
     def remove(self, dest: Path) -> bool:
         """Remove an entry by destination path."""
-        for i, entry in enumerate(self.entries):
-            if entry.dest == dest:
-                self.entries.pop(i)
-                self.save()
-                return True
-        return False
+        entry = self._by_dest.pop(dest, None)
+        if entry is None:
+            return False
+        self.entries.remove(entry)
+        self._platform_cache.clear()
+        self.save()
+        return True
 
     def find_by_dest(self, dest: Path) -> Optional[FileEntry]:
         """Find entry by destination path."""
-        for entry in self.entries:
-            if entry.dest == dest:
-                return entry
-        return None
+        return self._by_dest.get(dest)
+
+    def map_entries(self, fn, platform: str, workers: Optional[int] = None) -> list:
+        """Apply fn to every entry for a platform using a thread pool.
+
+        Per-entry checks are independent and I/O-bound (stats, reads),
+        so threads overlap the syscalls. Results are returned in entry
+        order; single-entry manifests skip the pool entirely.
+        """
+        entries = self.for_platform(platform)
+        if len(entries) <= 1:
+            return [fn(e) for e in entries]
+
+        if workers is None:
+            workers = max(1, min(8, (os.cpu_count() or 1) * 2, len(entries)))
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fn, entries))
 
     def for_platform(self, platform: str) -> list[FileEntry]:
-        """Filter entries for given platform."""
-        return [
-            e for e in self.entries
-            if e.platform is None or e.platform == platform
-        ]
+        """Filter entries for given platform (cached per instance)."""
+        cached = self._platform_cache.get(platform)
+        if cached is None:
+            cached = self._platform_cache[platform] = [
+                e for e in self.entries
+                if e.platform is None or e.platform == platform
+            ]
+        return cached
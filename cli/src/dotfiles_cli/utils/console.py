@@ -1,43 +1,120 @@
 """Console output utilities using Rich."""
 
-from rich.console import Console
-from rich.table import Table
+import contextlib
+import sys
+from typing import Optional
 
-console = Console()
+
+class _LazyConsole:
+    """Defers the Rich import until something is actually printed.
+
+    Rich costs tens of milliseconds to import; entrypoints that only
+    probe (has_command, shell completion) should not pay it. The proxy
+    forwards attribute access to a real Console built on first use, so
+    existing ``from .console import console`` call sites are unchanged.
+    """
+
+    _real = None
+
+    def _load(self):
+        if _LazyConsole._real is None:
+            from rich.console import Console
+
+            _LazyConsole._real = Console()
+        return _LazyConsole._real
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+
+console = _LazyConsole()
+
+# Active batch buffer, or None when emitting directly
+_batch_buffer: Optional[list] = None
+
+
+def _emit(markup: str):
+    """Print markup now, or queue it inside an active batch() block."""
+    if _batch_buffer is not None:
+        _batch_buffer.append(markup)
+    else:
+        console.print(markup)
+
+
+@contextlib.contextmanager
+def batch():
+    """Buffer helper output and flush it in a single console.print.
+
+    Rich resolves styles and flushes per print call; a burst of status
+    lines (e.g. collating parallel deploy results) pays that once when
+    wrapped in this block. Only use around pure-Python output \u2014 buffered
+    lines would print out of order against subprocess output.
+    """
+    global _batch_buffer
+    if _batch_buffer is not None:
+        # Nested: let the outer batch flush everything
+        yield
+        return
+
+    _batch_buffer = []
+    try:
+        yield
+    finally:
+        lines, _batch_buffer = _batch_buffer, None
+        if lines:
+            console.print("\n".join(lines))
 
 
 def success(msg: str):
     """Print success message."""
-    console.print(f"[green]\u2713[/green] {msg}")
+    _emit(f"[green]\u2713[/green] {msg}")
 
 
 def error(msg: str):
     """Print error message."""
-    console.print(f"[red]\u2717[/red] {msg}")
+    _emit(f"[red]\u2717[/red] {msg}")
 
 
 def warning(msg: str):
     """Print warning message."""
-    console.print(f"[yellow]![/yellow] {msg}")
+    _emit(f"[yellow]![/yellow] {msg}")
 
 
 def info(msg: str):
     """Print info message."""
-    console.print(f"[blue]\u2192[/blue] {msg}")
+    _emit(f"[blue]\u2192[/blue] {msg}")
 
 
 def header(msg: str):
     """Print section header."""
-    console.print(f"\n[bold]==> {msg}[/bold]")
+    _emit(f"\n[bold]==> {msg}[/bold]")
+
+
+# Precomputed SGR pair for dim(); run() traces every subprocess
+# through it, so it skips Rich's markup parser entirely
+_DIM_ON = "\x1b[2m"
+_DIM_OFF = "\x1b[0m"
 
 
 def dim(msg: str):
-    """Print dimmed text."""
-    console.print(f"[dim]{msg}[/dim]")
+    """Print dimmed text.
 
+    Hot path: written directly instead of through Rich - a precomputed
+    ANSI pair on a terminal, plain text when piped. The styled helpers
+    above stay on Rich, where markup actually matters.
+    """
+    if _batch_buffer is not None:
+        _batch_buffer.append(f"[dim]{msg}[/dim]")
+    elif sys.stdout.isatty():
+        print(_DIM_ON + msg + _DIM_OFF)
+    else:
+        print(msg)
 
-def create_table(*columns: str) -> Table:
+
+def create_table(*columns: str):
     """Create a table with given columns."""
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold")
     for col in columns:
         table.add_column(col)
@@ -1,25 +1,156 @@
 """Git operation utilities."""
 
+import functools
+import os
+import subprocess
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 from .run import run, run_quiet
 
 
+@functools.lru_cache(maxsize=8)
+def _git_prefix(repo: Path) -> Optional[tuple[str, ...]]:
+    """Argv prefix that skips git's repo discovery for a known repo.
+
+    Passing --git-dir/--work-tree saves the upward .git walk on every
+    probe and lets the helpers drop the cwd= kwarg, keeping subprocess
+    on its posix_spawn fast path; gc.auto=0 stops read-only probes
+    from kicking off background maintenance. Returns None when .git is
+    a gitfile (worktrees, submodules), which --git-dir can't follow.
+    """
+    if not (repo / ".git").is_dir():
+        return None
+    return (
+        "git",
+        "-c", "gc.auto=0",
+        "--git-dir", str(repo / ".git"),
+        "--work-tree", str(repo),
+    )
+
+
+def _run_git(repo: Path, *args: str):
+    """run_quiet a read-only git command against repo."""
+    prefix = _git_prefix(repo)
+    if prefix is not None:
+        return run_quiet([*prefix, *args])
+    return run_quiet(["git", *args], cwd=repo)
+
+
+def find_repo_root(start: Path = Path(".")) -> Optional[Path]:
+    """Locate the enclosing git work tree without spawning git.
+
+    Walks up from start looking for a .git entry (dir or worktree file).
+    Returns the work tree root, or None when outside any repo.
+    """
+    path = start.resolve()
+    for candidate in [path, *path.parents]:
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+@dataclass
+class RepoState:
+    """Snapshot of a repo's branch, upstream counts, and cleanliness."""
+
+    branch: str = ""
+    ahead: Optional[int] = None
+    behind: Optional[int] = None
+    clean: bool = True
+
+
+def get_repo_state(repo: Path) -> Optional[RepoState]:
+    """Read branch, ahead/behind and cleanliness in one git call.
+
+    status --porcelain=v2 --branch reports everything the separate
+    current_branch / ahead_behind / is_clean probes would, for one fork
+    instead of three. Returns None when the path isn't a repo.
+    """
+    result = _run_git(repo, "status", "--porcelain=v2", "--branch")
+    if result.returncode != 0:
+        return None
+
+    state = RepoState()
+    for line in result.stdout.splitlines():
+        if line.startswith("# branch.head "):
+            state.branch = line[len("# branch.head "):]
+        elif line.startswith("# branch.ab "):
+            # "# branch.ab +<ahead> -<behind>"
+            ahead, behind = line[len("# branch.ab "):].split()
+            state.ahead = int(ahead)
+            state.behind = -int(behind)
+        elif not line.startswith("#"):
+            state.clean = False
+    return state
+
+
 def git_status(repo: Path) -> str:
     """Get git status output."""
-    result = run_quiet(["git", "status", "--porcelain"], cwd=repo)
+    result = _run_git(repo, "status", "--porcelain")
     return result.stdout.strip()
 
 
 def is_clean(repo: Path) -> bool:
-    """Check if repo has no uncommitted changes."""
-    return git_status(repo) == ""
+    """Check if repo has no uncommitted changes.
+
+    Reads a single byte of status output instead of the whole listing:
+    any byte means dirty, and terminating git early stops its worktree
+    walk rather than letting it enumerate every change we'd discard.
+    """
+    prefix = _git_prefix(repo)
+    proc = subprocess.Popen(
+        [*prefix, "status", "--porcelain"] if prefix else ["git", "status", "--porcelain"],
+        cwd=None if prefix else repo,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    first = proc.stdout.read(1)
+    if first:
+        proc.terminate()
+    proc.stdout.close()
+    proc.wait()
+    return not first
+
+
+# Branch name keyed on .git/HEAD's (mtime_ns, size): the answer only
+# changes when HEAD is rewritten, so one stat replaces a git fork on
+# repeat lookups
+_BRANCH_CACHE: dict[Path, tuple[tuple[int, int], str]] = {}
 
 
 def current_branch(repo: Path) -> str:
-    """Get current branch name."""
-    result = run_quiet(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo)
+    """Get current branch name (cached while .git/HEAD is unchanged)."""
+    try:
+        st = os.stat(repo / ".git" / "HEAD")
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        # Gitfile layouts: no direct HEAD to watch, always ask git
+        key = None
+
+    if key is not None:
+        cached = _BRANCH_CACHE.get(repo)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+    result = _run_git(repo, "rev-parse", "--abbrev-ref", "HEAD")
+    branch = result.stdout.strip()
+    if key is not None:
+        _BRANCH_CACHE[repo] = (key, branch)
+    return branch
+
+
+@functools.lru_cache(maxsize=4)
+def remote_url(repo: Path, remote: str = "origin") -> Optional[str]:
+    """Get a remote's URL, or None if unset.
+
+    Cached: remotes don't change within a process, so repeat callers
+    skip the subprocess.
+    """
+    result = _run_git(repo, "remote", "get-url", remote)
+    if result.returncode != 0:
+        return None
     return result.stdout.strip()
 
 
@@ -50,35 +181,51 @@ def commit(repo: Path, message: str) -> bool:
     return result.returncode == 0
 
 
+def commit_all(repo: Path, message: str) -> bool:
+    """Stage everything and commit in one shell invocation.
+
+    Collapses the add_all + commit pair into a single fork; the message
+    is passed as a positional argument, not interpolated into the
+    command string, so no quoting is needed.
+    """
+    result = run(
+        ["sh", "-c", 'git add -A && git commit -m "$1"', "--", message],
+        cwd=repo,
+        check=False,
+    )
+    return result.returncode == 0
+
+
 def diff_stat(repo: Path) -> str:
     """Get diff stat output."""
-    result = run_quiet(["git", "diff", "--stat"], cwd=repo)
+    result = _run_git(repo, "diff", "--stat")
     return result.stdout.strip()
 
 
-def is_ahead_of_remote(repo: Path) -> Optional[int]:
-    """Check how many commits ahead of remote. Returns None if no remote."""
-    result = run_quiet(
-        ["git", "rev-list", "--count", "@{upstream}..HEAD"],
-        cwd=repo
-    )
+def ahead_behind(repo: Path) -> Optional[tuple[int, int]]:
+    """Get (ahead, behind) counts against upstream in one git call.
+
+    rev-list --left-right --count walks the symmetric difference once
+    and reports both sides, where separate ahead/behind queries spawn
+    git twice and walk the history twice. Returns None if no upstream.
+    """
+    result = _run_git(repo, "rev-list", "--left-right", "--count", "HEAD...@{upstream}")
     if result.returncode != 0:
         return None
     try:
-        return int(result.stdout.strip())
+        ahead, behind = result.stdout.split()
+        return int(ahead), int(behind)
     except ValueError:
         return None
 
 
+def is_ahead_of_remote(repo: Path) -> Optional[int]:
+    """Check how many commits ahead of remote. Returns None if no remote."""
+    counts = ahead_behind(repo)
+    return counts[0] if counts else None
+
+
 def is_behind_remote(repo: Path) -> Optional[int]:
     """Check how many commits behind remote. Returns None if no remote."""
-    result = run_quiet(
-        ["git", "rev-list", "--count", "HEAD..@{upstream}"],
-        cwd=repo
-    )
-    if result.returncode != 0:
-        return None
-    try:
-        return int(result.stdout.strip())
-    except ValueError:
-        return None
+    counts = ahead_behind(repo)
+    return counts[1] if counts else None
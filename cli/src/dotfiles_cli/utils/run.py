@@ -1,12 +1,20 @@
 """Shell command execution utilities."""
 
+import functools
+import os
+import shlex
 import subprocess
 import shutil
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from .console import dim, error
 
+# Command traces are interactive chrome; when output is piped into
+# another program they are skipped entirely unless explicitly forced
+_TRACE = sys.stdout.isatty() or os.environ.get("DOTFILES_FORCE_TRACE") == "1"
+
 
 def run(
     cmd: list[str],
@@ -14,6 +22,7 @@ def run(
     check: bool = True,
     capture: bool = False,
     quiet: bool = False,
+    extra_env: Optional[dict[str, str]] = None,
 ) -> subprocess.CompletedProcess:
     """Run a shell command.
 
@@ -23,12 +32,15 @@ def run(
         check: Raise exception on non-zero exit
         capture: Capture stdout/stderr
         quiet: Don't print command
+        extra_env: Variables overlaid on the inherited environment
 
     Returns:
         CompletedProcess instance
     """
-    if not quiet:
-        dim(f"$ {' '.join(cmd)}")
+    if not quiet and _TRACE:
+        # Only the traced path pays for formatting; shlex.join quotes
+        # arguments so the printed line is actually re-runnable
+        dim("$ " + shlex.join(cmd))
 
     kwargs = {
         "cwd": cwd,
@@ -39,6 +51,10 @@ def run(
         kwargs["capture_output"] = True
         kwargs["text"] = True
 
+    if extra_env:
+        # Only pay for the environ copy when there is something to add
+        kwargs["env"] = {**os.environ, **extra_env}
+
     return subprocess.run(cmd, **kwargs)
 
 
@@ -47,11 +63,119 @@ def run_quiet(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
     return subprocess.run(cmd, capture_output=True, text=True, **kwargs)
 
 
+def pipeline(stages: list[list[str]], cwd: Optional[Path] = None) -> subprocess.CompletedProcess:
+    """Run commands connected by OS pipes, all stages concurrent.
+
+    Each stage reads its predecessor's stdout straight from the kernel
+    pipe, so nothing is buffered through Python and the stages overlap
+    instead of serializing. The parent's copy of each intermediate
+    stdout is closed so SIGPIPE propagates upstream if a later stage
+    exits early. Returns a CompletedProcess for the final stage with
+    its captured stdout/stderr (bytes).
+    """
+    procs = []
+    prev_out = None
+    for i, cmd in enumerate(stages):
+        last = i == len(stages) - 1
+        proc = subprocess.Popen(
+            cmd,
+            stdin=prev_out,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if last else subprocess.DEVNULL,
+            cwd=cwd,
+        )
+        if prev_out is not None:
+            prev_out.close()
+        prev_out = proc.stdout
+        procs.append(proc)
+
+    out, err = procs[-1].communicate()
+    for proc in procs[:-1]:
+        proc.wait()
+    return subprocess.CompletedProcess(stages[-1], procs[-1].returncode, out, err)
+
+
+@functools.lru_cache(maxsize=256)
 def has_command(cmd: str) -> bool:
-    """Check if a command exists in PATH."""
+    """Check if a command exists in PATH.
+
+    A DOTFILES_HAVE_<NAME>=0/1 environment override wins when set;
+    remote deploys use this to hand a pre-probed capability set to
+    bootstrap so it never re-scans PATH per tool.
+
+    Otherwise a pure in-process PATH walk (shutil.which) — never shells
+    out to ``command -v``/``which``, which matters on WSL where spawning
+    a subprocess per probe is especially slow.
+
+    Cached for the life of the process: PATH does not change within a
+    CLI run, and several commands probe the same tools repeatedly.
+    """
+    override = os.environ.get(have_command_var(cmd))
+    if override is not None:
+        return override == "1"
     return shutil.which(cmd) is not None
 
 
+def have_command_var(cmd: str) -> str:
+    """Environment variable name carrying a has_command override."""
+    return "DOTFILES_HAVE_" + "".join(
+        c if c.isalnum() else "_" for c in cmd.upper()
+    )
+
+
+# Suffixes a Windows PATH lookup would resolve implicitly
+_WIN_EXE_SUFFIXES = (".exe", ".bat", ".cmd", ".com")
+
+
+def which_many(names: Iterable[str]) -> dict[str, bool]:
+    """Check several commands against a single PATH scan.
+
+    Walks each PATH directory once and tests membership, instead of
+    resolving every name separately like has_command does. Only
+    executable regular files count, so the answers agree with
+    shutil.which; the stat/access probes run for the requested names
+    only, keeping the scan itself one readdir per directory.
+
+    DOTFILES_HAVE_<NAME> overrides win exactly as in has_command, so
+    the capability set deploy hands to bootstrap also covers callers
+    that probe in bulk; only names without an override hit the scan.
+    """
+    results: dict[str, bool] = {}
+    wanted: set[str] = set()
+    for name in names:
+        override = os.environ.get(have_command_var(name))
+        if override is not None:
+            results[name] = override == "1"
+        else:
+            wanted.add(name)
+    if not wanted:
+        return results
+
+    found: set[str] = set()
+    strip_suffixes = sys.platform == "win32" or os.environ.get("PATHEXT")
+    for path_dir in os.environ.get("PATH", "").split(os.pathsep):
+        if not path_dir:
+            continue
+        try:
+            with os.scandir(path_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if strip_suffixes and name.lower().endswith(_WIN_EXE_SUFFIXES):
+                        name = name[: name.rfind(".")]
+                    if name not in wanted or name in found:
+                        continue
+                    try:
+                        if entry.is_file() and os.access(entry.path, os.X_OK):
+                            found.add(name)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+    results.update({name: name in found for name in wanted})
+    return results
+
+
 def require_command(cmd: str, install_hint: str = ""):
     """Ensure a command exists, exit with error if not."""
     if not has_command(cmd):